@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Final
 
 from homeassistant.config_entries import ConfigEntry
 from homeassistant.const import CONF_HOST, CONF_PORT, Platform
@@ -29,7 +29,7 @@ from .models import DeviceInfo as TsuryDeviceInfo
 _LOGGER = logging.getLogger(__name__)
 
 # Platforms to set up
-PLATFORMS: list[Platform] = [
+PLATFORMS: Final[tuple[Platform, ...]] = (
     Platform.BINARY_SENSOR,
     Platform.SENSOR,
     Platform.SWITCH,
@@ -37,7 +37,7 @@ PLATFORMS: list[Platform] = [
     Platform.SELECT,
     Platform.BUTTON,
     Platform.TEXT,
-]
+)
 
 if TYPE_CHECKING:
     TsuryPhoneConfigEntry = ConfigEntry[TsuryPhoneDataUpdateCoordinator]
@@ -176,6 +176,8 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     # Create and initialize coordinator
     _LOGGER.info("========== CREATING COORDINATOR ==========")
     coordinator = TsuryPhoneDataUpdateCoordinator(hass, api_client, device_info)
+    # The first refresh would GET the same config again; hand it the one we have
+    coordinator.seed_config_response(config_response)
     _LOGGER.info("Coordinator created, data state: %s", coordinator.data)
 
     # Phase P7: Set up storage cache BEFORE first refresh
@@ -219,11 +221,19 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     except Exception as err:
         _LOGGER.error("Failed to load cached device state: %s", err, exc_info=True)
 
+    # Fetch the diagnostics snapshot (statistics) alongside the first refresh
+    # (config/state); both use the shared HTTP session and touch disjoint state
+    diagnostics_task = hass.async_create_task(coordinator.async_refresh_diagnostics())
+
     # Perform first refresh to populate initial state (will preserve call_history now)
-    await coordinator.async_config_entry_first_refresh()
+    try:
+        await coordinator.async_config_entry_first_refresh()
+    except Exception:
+        diagnostics_task.cancel()
+        raise
 
-    # Fetch diagnostics snapshot to hydrate statistics before entities are created
-    await coordinator.async_refresh_diagnostics()
+    # Statistics must be hydrated before entities are created
+    await diagnostics_task
 
     # Store coordinator in runtime data for platform access
     entry.runtime_data = coordinator
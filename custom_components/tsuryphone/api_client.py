@@ -3,13 +3,13 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 from typing import Any
 
 import aiohttp
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
 
 from .const import (
     API_CONFIG_TSURYPHONE,
@@ -77,6 +77,9 @@ class TsuryPhoneAPIClient:
         self._host = host
         self._port = port
         self._base_url = f"http://{host}:{port}"
+        self._websocket_url = f"ws://{host}:{port}/ws"
+        # Endpoint -> absolute URL, filled on first use of each endpoint
+        self._urls: dict[str, str] = {}
         self._session = async_get_clientsession(hass)
         self._request_timeout = 10.0
 
@@ -88,24 +91,24 @@ class TsuryPhoneAPIClient:
     @property
     def websocket_url(self) -> str:
         """Get WebSocket URL for the device."""
-        return f"ws://{self._host}:{self._port}/ws"
+        return self._websocket_url
 
     async def _request(
         self, method: str, endpoint: str, data: dict[str, Any] | None = None
     ) -> dict[str, Any]:
         """Make HTTP request to device."""
-        url = f"{self._base_url}{endpoint}"
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = self._urls[endpoint] = f"{self._base_url}{endpoint}"
 
         try:
             async with asyncio.timeout(self._request_timeout):
-                if method.upper() == "GET":
+                if method == "GET":
                     async with self._session.get(url) as response:
                         return await self._handle_response(response, endpoint)
-                elif method.upper() == "POST":
-                    headers = {"Content-Type": "application/json"}
-                    async with self._session.post(
-                        url, json=data or {}, headers=headers
-                    ) as response:
+                elif method == "POST":
+                    # json= already sends Content-Type: application/json
+                    async with self._session.post(url, json=data or {}) as response:
                         return await self._handle_response(response, endpoint)
                 else:
                     raise ValueError(f"Unsupported HTTP method: {method}")
@@ -122,8 +125,8 @@ class TsuryPhoneAPIClient:
     ) -> dict[str, Any]:
         """Handle HTTP response from device."""
         try:
-            response_data = await response.json()
-        except json.JSONDecodeError as err:
+            response_data = await response.json(loads=json_loads)
+        except ValueError as err:  # orjson and stdlib decode errors
             _LOGGER.error("Invalid JSON response from %s: %s", endpoint, err)
             raise TsuryPhoneAPIError("Invalid JSON response") from err
 
@@ -3,11 +3,13 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Iterable
+from collections.abc import Mapping
+from types import MappingProxyType
+from typing import Any, Final, Iterable
 
 from homeassistant.components.button import ButtonEntity, ButtonEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -32,6 +34,66 @@ from .dialing import DialingContext
 
 _LOGGER = logging.getLogger(__name__)
 
+# Shared read-only fallback for optional mapping fields in API responses
+_EMPTY_MAPPING: Final[Mapping[str, Any]] = MappingProxyType({})
+
+# Buttons that require a live device connection before anything else is checked
+_CONNECTED_ACTION_KEYS: Final = frozenset(
+    {
+        "answer",
+        "hangup",
+        "ring",
+        "reset",
+        "toggle_volume_mode",
+        "toggle_call_waiting",
+        "toggle_mute",
+    }
+)
+
+# Buttons acting on the coordinator's management buffers and selections
+_MANAGEMENT_KEYS: Final = frozenset(
+    {
+        "quick_dial_add",
+        "quick_dial_remove",
+        "blocked_add",
+        "blocked_remove",
+        "priority_add",
+        "priority_remove",
+        "webhook_add",
+        "webhook_remove",
+    }
+)
+
+_REFRESH_KEYS: Final = frozenset({"refetch", "refresh_snapshot"})
+
+# Description key -> TsuryPhoneButton coroutine method run on press
+_PRESS_HANDLERS: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "answer": "_answer_call",
+        "hangup": "_hangup_call",
+        "ring": "_ring_device",
+        "reset": "_reset_device",
+        "factory_reset": "_factory_reset_device",
+        "refetch": "_refetch_data",
+        "refresh_snapshot": "_refresh_snapshot",
+        "dial_selected": "_dial_selected_quick_dial",
+        "dial_digit_send": "_dial_digit_from_buffer",
+        "send_dialed_number": "_send_dialed_number",
+        "delete_last_digit": "_delete_last_digit",
+        "quick_dial_add": "_add_quick_dial_entry",
+        "quick_dial_remove": "_remove_selected_quick_dial",
+        "blocked_add": "_add_blocked_number",
+        "blocked_remove": "_remove_selected_blocked_number",
+        "priority_add": "_add_priority_number",
+        "priority_remove": "_remove_selected_priority_number",
+        "webhook_add": "_add_webhook_action",
+        "webhook_remove": "_remove_selected_webhook",
+        "toggle_volume_mode": "_toggle_volume_mode",
+        "toggle_call_waiting": "_toggle_call_waiting",
+        "toggle_mute": "_toggle_mute",
+    }
+)
+
 BUTTON_DESCRIPTIONS = (
     ButtonEntityDescription(
         key="dial_digit_send",
@@ -262,50 +324,7 @@ class TsuryPhoneButton(
     async def async_press(self) -> None:
         """Handle the button press."""
         try:
-            if self.entity_description.key == "answer":
-                await self._answer_call()
-            elif self.entity_description.key == "hangup":
-                await self._hangup_call()
-            elif self.entity_description.key == "ring":
-                await self._ring_device()
-            elif self.entity_description.key == "reset":
-                await self._reset_device()
-            elif self.entity_description.key == "factory_reset":
-                await self._factory_reset_device()
-            elif self.entity_description.key == "refetch":
-                await self._refetch_data()
-            elif self.entity_description.key == "refresh_snapshot":
-                await self._refresh_snapshot()
-            elif self.entity_description.key == "dial_selected":
-                await self._dial_selected_quick_dial()
-            elif self.entity_description.key == "dial_digit_send":
-                await self._dial_digit_from_buffer()
-            elif self.entity_description.key == "send_dialed_number":
-                await self._send_dialed_number()
-            elif self.entity_description.key == "delete_last_digit":
-                await self._delete_last_digit()
-            elif self.entity_description.key == "quick_dial_add":
-                await self._add_quick_dial_entry()
-            elif self.entity_description.key == "quick_dial_remove":
-                await self._remove_selected_quick_dial()
-            elif self.entity_description.key == "blocked_add":
-                await self._add_blocked_number()
-            elif self.entity_description.key == "blocked_remove":
-                await self._remove_selected_blocked_number()
-            elif self.entity_description.key == "priority_add":
-                await self._add_priority_number()
-            elif self.entity_description.key == "priority_remove":
-                await self._remove_selected_priority_number()
-            elif self.entity_description.key == "webhook_add":
-                await self._add_webhook_action()
-            elif self.entity_description.key == "webhook_remove":
-                await self._remove_selected_webhook()
-            elif self.entity_description.key == "toggle_volume_mode":
-                await self._toggle_volume_mode()
-            elif self.entity_description.key == "toggle_call_waiting":
-                await self._toggle_call_waiting()
-            elif self.entity_description.key == "toggle_mute":
-                await self._toggle_mute()
+            await getattr(self, _PRESS_HANDLERS[self.entity_description.key])()
         except TsuryPhoneAPIError as err:
             # Provide user-friendly error messages
             error_msg = self._get_user_friendly_error(err)
@@ -387,11 +406,8 @@ class TsuryPhoneButton(
 
     async def _refresh_snapshot(self) -> None:
         """Refresh diagnostic snapshot."""
-        # Get diagnostics from device and update coordinator
-        diag_data = await self.coordinator.api_client.get_diagnostics()
-
-        # Trigger coordinator refresh
-        await self.coordinator.async_request_refresh()
+        # Coordinator fetches the snapshot, applies the metrics and notifies listeners
+        await self.coordinator.async_refresh_diagnostics(raise_on_error=True)
 
     async def _dial_selected_quick_dial(self) -> None:
         """Dial the selected quick dial entry."""
@@ -453,7 +469,6 @@ class TsuryPhoneButton(
 
         # Clear the buffer so the UI input resets after sending
         self._clear_buffer("dial_digit", ("digit",))
-        self.coordinator.async_update_listeners()
 
     async def _add_quick_dial_entry(self) -> None:
         """Add a quick dial entry from buffered text inputs."""
@@ -483,13 +498,13 @@ class TsuryPhoneButton(
                 device_number, name, code
             )
             # Extract the ID from the response and set as selected
-            entry_data = response.get("data", {}).get("entry", {})
+            entry_data = response.get("data", _EMPTY_MAPPING).get("entry", _EMPTY_MAPPING)
             entry_id = entry_data.get("id")
             if entry_id:
                 self.coordinator.selected_quick_dial_id = entry_id
             self.coordinator.remember_number_display_hint(number)
             self._clear_buffer("quick_dial")
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_refresh_if_disconnected()
         except TsuryPhoneAPIError as err:
             raise HomeAssistantError(f"Failed to add quick dial entry: {err}") from err
 
@@ -504,7 +519,7 @@ class TsuryPhoneButton(
             await self.coordinator.api_client.remove_quick_dial_by_id(selected_id)
             self.coordinator.selected_quick_dial_id = None
             self._clear_buffer("quick_dial")
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_refresh_if_disconnected()
         except TsuryPhoneAPIError as err:
             raise HomeAssistantError(
                 f"Failed to remove quick dial entry '{selected_id}': {err}"
@@ -529,13 +544,13 @@ class TsuryPhoneButton(
                 device_number, name
             )
             # Extract the ID from the response and set as selected
-            entry_data = response.get("data", {}).get("entry", {})
+            entry_data = response.get("data", _EMPTY_MAPPING).get("entry", _EMPTY_MAPPING)
             entry_id = entry_data.get("id")
             if entry_id:
                 self.coordinator.selected_blocked_number_id = entry_id
             self.coordinator.remember_number_display_hint(number)
             self._clear_buffer("blocked")
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_refresh_if_disconnected()
         except TsuryPhoneAPIError as err:
             raise HomeAssistantError(f"Failed to add blocked number: {err}") from err
 
@@ -550,7 +565,7 @@ class TsuryPhoneButton(
             await self.coordinator.api_client.remove_blocked_number_by_id(selected_id)
             self.coordinator.selected_blocked_number_id = None
             self._clear_buffer("blocked")
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_refresh_if_disconnected()
         except TsuryPhoneAPIError as err:
             raise HomeAssistantError(
                 f"Failed to remove blocked number '{selected_id}': {err}"
@@ -571,13 +586,13 @@ class TsuryPhoneButton(
                 device_number
             )
             # Extract the ID from the response and set as selected
-            entry_data = response.get("data", {}).get("entry", {})
+            entry_data = response.get("data", _EMPTY_MAPPING).get("entry", _EMPTY_MAPPING)
             entry_id = entry_data.get("id")
             if entry_id:
                 self.coordinator.selected_priority_number_id = entry_id
             self.coordinator.remember_number_display_hint(number)
             self._clear_buffer("priority")
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_refresh_if_disconnected()
         except TsuryPhoneAPIError as err:
             raise HomeAssistantError(
                 f"Failed to add priority number '{number}': {err}"
@@ -594,7 +609,7 @@ class TsuryPhoneButton(
             await self.coordinator.api_client.remove_priority_caller_by_id(selected_id)
             self.coordinator.selected_priority_number_id = None
             self._clear_buffer("priority")
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_refresh_if_disconnected()
         except TsuryPhoneAPIError as err:
             raise HomeAssistantError(
                 f"Failed to remove priority number '{selected_id}': {err}"
@@ -624,7 +639,7 @@ class TsuryPhoneButton(
             )
             self.coordinator.selected_webhook_code = code
             self._clear_buffer("webhook")
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_refresh_if_disconnected()
         except TsuryPhoneAPIError as err:
             raise HomeAssistantError(f"Failed to add webhook action: {err}") from err
 
@@ -639,7 +654,7 @@ class TsuryPhoneButton(
             await self.coordinator.api_client.remove_webhook_action(selected_code)
             self.coordinator.selected_webhook_code = None
             self._clear_buffer("webhook")
-            await self.coordinator.async_request_refresh()
+            await self.coordinator.async_refresh_if_disconnected()
         except TsuryPhoneAPIError as err:
             raise HomeAssistantError(
                 f"Failed to remove webhook '{selected_code}': {err}"
@@ -708,10 +723,10 @@ class TsuryPhoneButton(
         else:
             return str(error)
 
-    @property
-    def extra_state_attributes(self) -> dict[str, Any] | None:
+    def _compute_extra_state_attributes(self) -> dict[str, Any] | None:
         """Return additional state attributes."""
         state: TsuryPhoneState = self.coordinator.data
+        key = self.entity_description.key
         attributes = {}
 
         # Add restoration indicator if available
@@ -719,12 +734,12 @@ class TsuryPhoneButton(
             attributes["restored"] = True
 
         # Add specific attributes per button type
-        if self.entity_description.key == "answer":
+        if key == "answer":
             attributes["can_execute"] = state.is_incoming_call
             if state.is_incoming_call and state.current_call.number:
                 attributes["incoming_number"] = state.current_call.number
 
-        elif self.entity_description.key == "hangup":
+        elif key == "hangup":
             can_execute = bool(
                 state.is_call_active
                 or state.is_incoming_call
@@ -742,24 +757,24 @@ class TsuryPhoneButton(
             if state.current_dialing_number:
                 attributes["current_dialing_number"] = state.current_dialing_number
 
-        elif self.entity_description.key == "toggle_volume_mode":
+        elif key == "toggle_volume_mode":
             attributes["can_execute"] = state.is_call_active
             attributes["current_volume_mode"] = state.volume_mode_label
             attributes["volume_mode_code"] = state.volume_mode_code
             attributes["is_speaker_mode"] = state.is_speaker_mode
 
-        elif self.entity_description.key == "toggle_mute":
+        elif key == "toggle_mute":
             attributes["can_execute"] = state.is_call_active
             attributes["is_muted"] = state.is_muted
 
-        elif self.entity_description.key == "ring":
+        elif key == "ring":
             attributes["current_ring_pattern"] = state.ring_pattern or "default"
 
-        elif self.entity_description.key == "toggle_call_waiting":
+        elif key == "toggle_call_waiting":
             attributes["can_execute"] = state.call_waiting_available
             attributes["call_waiting_available"] = state.call_waiting_available
 
-        elif self.entity_description.key == "dial_selected":
+        elif key == "dial_selected":
             # Phase P4: Show actual selection state
             has_selection = (
                 hasattr(self.coordinator, "selected_quick_dial_id")
@@ -780,7 +795,7 @@ class TsuryPhoneButton(
             else:
                 attributes["selected_quick_dial"] = None
 
-        elif self.entity_description.key == "dial_digit_send":
+        elif key == "dial_digit_send":
             buffer = self._get_buffer_snapshot("dial_digit")
             digit = buffer.get("digit", "")
             attributes["buffered_digit"] = digit
@@ -788,7 +803,7 @@ class TsuryPhoneButton(
             if state.current_dialing_number:
                 attributes["current_dialing_number"] = state.current_dialing_number
 
-        elif self.entity_description.key == "quick_dial_add":
+        elif key == "quick_dial_add":
             buffer = self._get_buffer_snapshot("quick_dial")
             has_required = self._buffer_has_values("quick_dial", ("code", "number"))
             attributes["can_execute"] = bool(has_required and state.connected)
@@ -805,12 +820,12 @@ class TsuryPhoneButton(
                 "name": buffer.get("name", ""),
             }
 
-        elif self.entity_description.key == "quick_dial_remove":
+        elif key == "quick_dial_remove":
             selected_id = getattr(self.coordinator, "selected_quick_dial_id", None)
             attributes["can_execute"] = bool(selected_id and state.connected)
             attributes["selected_id"] = selected_id
 
-        elif self.entity_description.key == "blocked_add":
+        elif key == "blocked_add":
             buffer = self._get_buffer_snapshot("blocked")
             has_required = self._buffer_has_values("blocked", ("number", "name"))
             attributes["can_execute"] = bool(has_required and state.connected)
@@ -823,12 +838,12 @@ class TsuryPhoneButton(
                 "name": buffer.get("name", ""),
             }
 
-        elif self.entity_description.key == "blocked_remove":
+        elif key == "blocked_remove":
             selected_id = getattr(self.coordinator, "selected_blocked_number_id", None)
             attributes["can_execute"] = bool(selected_id and state.connected)
             attributes["selected_id"] = selected_id
 
-        elif self.entity_description.key == "priority_add":
+        elif key == "priority_add":
             buffer = self._get_buffer_snapshot("priority")
             has_required = self._buffer_has_values("priority", ("number",))
             attributes["can_execute"] = bool(has_required and state.connected)
@@ -836,12 +851,12 @@ class TsuryPhoneButton(
                 attributes["missing_fields"] = ["number"]
             attributes["buffer"] = {"number": buffer.get("number", "")}
 
-        elif self.entity_description.key == "priority_remove":
+        elif key == "priority_remove":
             selected_id = getattr(self.coordinator, "selected_priority_number_id", None)
             attributes["can_execute"] = bool(selected_id and state.connected)
             attributes["selected_id"] = selected_id
 
-        elif self.entity_description.key == "webhook_add":
+        elif key == "webhook_add":
             buffer = self._get_buffer_snapshot("webhook")
             has_required = self._buffer_has_values("webhook", ("code", "webhook_id"))
             attributes["required_fields"] = ["code", "webhook_id"]
@@ -858,12 +873,12 @@ class TsuryPhoneButton(
             }
             attributes["can_execute"] = bool(has_required and state.connected)
 
-        elif self.entity_description.key == "webhook_remove":
+        elif key == "webhook_remove":
             selected_code = getattr(self.coordinator, "selected_webhook_code", None)
             attributes["can_execute"] = bool(selected_code and state.connected)
             attributes["selected_code"] = selected_code
 
-        elif self.entity_description.key in ["refetch", "refresh_snapshot"]:
+        elif key in _REFRESH_KEYS:
             # Show last update time
             if hasattr(self.coordinator, "last_update_time"):
                 attributes["last_refresh"] = self.coordinator.last_update_time
@@ -880,28 +895,46 @@ class TsuryPhoneButton(
 
     @property
     def available(self) -> bool:
+        """Return the cached per-button availability."""
+        # CoordinatorEntity.available would otherwise shadow _attr_available
+        return self._attr_available
+
+    async def async_added_to_hass(self) -> None:
+        """Prime the cached availability and attributes when the entity is added."""
+        self._attr_available = self._compute_available()
+        self._attr_extra_state_attributes = self._compute_extra_state_attributes()
+        await super().async_added_to_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when availability or attributes actually changed."""
+        available = self._compute_available()
+        attributes = self._compute_extra_state_attributes()
+        # Compare against what the entity publishes, not private attributes
+        if available == self.available and attributes == self.extra_state_attributes:
+            return
+
+        self._attr_available = available
+        self._attr_extra_state_attributes = attributes
+        self.async_write_ha_state()
+
+    def _compute_available(self) -> bool:
         """Return if entity is available."""
         state: TsuryPhoneState = self.coordinator.data
+        key = self.entity_description.key
+        online = self.coordinator.last_update_success and state.connected
 
         # Most buttons require device connection
-        if self.entity_description.key in [
-            "answer",
-            "hangup",
-            "ring",
-            "reset",
-            "toggle_volume_mode",
-            "toggle_call_waiting",
-            "toggle_mute",
-        ]:
-            if not (self.coordinator.last_update_success and state.connected):
+        if key in _CONNECTED_ACTION_KEYS:
+            if not online:
                 return False
 
-            if self.entity_description.key == "answer":
+            if key == "answer":
                 if state.is_call_active:
                     return False
 
                 return bool(state.is_incoming_call or state.ringing)
-            if self.entity_description.key == "hangup":
+            if key == "hangup":
                 return bool(
                     state.is_call_active
                     or state.is_incoming_call
@@ -910,18 +943,18 @@ class TsuryPhoneButton(
                     or state.current_dialing_number
                     or state.app_state == AppState.INVALID_NUMBER
                 )
-            if self.entity_description.key == "toggle_volume_mode":
+            if key == "toggle_volume_mode":
                 return state.is_call_active
-            if self.entity_description.key == "toggle_mute":
+            if key == "toggle_mute":
                 return state.is_call_active
-            if self.entity_description.key == "toggle_call_waiting":
+            if key == "toggle_call_waiting":
                 return state.call_waiting_available
 
             return True
 
         # Send dialed number button - enabled only when send mode is on and there are digits
-        elif self.entity_description.key == "send_dialed_number":
-            if not (self.coordinator.last_update_success and state.connected):
+        elif key == "send_dialed_number":
+            if not online:
                 return False
             if not self.coordinator.send_mode_enabled:
                 return False
@@ -930,8 +963,8 @@ class TsuryPhoneButton(
             return True
 
         # Delete last digit button - enabled when there are digits to delete
-        elif self.entity_description.key == "delete_last_digit":
-            if not (self.coordinator.last_update_success and state.connected):
+        elif key == "delete_last_digit":
+            if not online:
                 return False
             if not state.current_dialing_number:
                 return False
@@ -940,11 +973,11 @@ class TsuryPhoneButton(
             return True
 
         # Data refresh buttons can work if we have coordinator data
-        elif self.entity_description.key in ["refetch", "refresh_snapshot"]:
-            return self.coordinator.last_update_success and state.connected
+        elif key in _REFRESH_KEYS:
+            return online
 
-        elif self.entity_description.key == "dial_digit_send":
-            if not (self.coordinator.last_update_success and state.connected):
+        elif key == "dial_digit_send":
+            if not online:
                 return False
 
             buffer = self._get_buffer_snapshot("dial_digit")
@@ -955,33 +988,18 @@ class TsuryPhoneButton(
             return state.app_state == AppState.IDLE
 
         # Phase P4 features
-        elif self.entity_description.key == "dial_selected":
+        elif key == "dial_selected":
             # Available if we have a selection and quick dial entries exist
             has_selection = (
                 hasattr(self.coordinator, "selected_quick_dial_id")
                 and self.coordinator.selected_quick_dial_id is not None
             )
-            return (
-                self.coordinator.last_update_success
-                and state.connected
-                and has_selection
-                and state.quick_dial_count > 0
-            )
+            return online and has_selection and state.quick_dial_count > 0
 
-        elif self.entity_description.key in [
-            "quick_dial_add",
-            "quick_dial_remove",
-            "blocked_add",
-            "blocked_remove",
-            "priority_add",
-            "priority_remove",
-            "webhook_add",
-            "webhook_remove",
-        ]:
-            if not (self.coordinator.last_update_success and state.connected):
+        elif key in _MANAGEMENT_KEYS:
+            if not online:
                 return False
 
-            key = self.entity_description.key
             if key == "quick_dial_add":
                 return self._buffer_has_values("quick_dial", ("code", "number"))
             if key == "quick_dial_remove":
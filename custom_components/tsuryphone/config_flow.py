@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from typing import Any
+from typing import Any, Final
 from urllib.parse import urlparse
 
 import voluptuous as vol
@@ -44,13 +44,21 @@ if TYPE_CHECKING:
 
 _LOGGER = logging.getLogger(__name__)
 
-STEP_USER_DATA_SCHEMA = vol.Schema(
+STEP_USER_DATA_SCHEMA: Final = vol.Schema(
     {
         vol.Required(CONF_HOST): str,
         vol.Optional(CONF_PORT, default=DEFAULT_PORT): vol.Coerce(int),
     }
 )
 
+# Static action menus for the options flow managers
+_LIST_MANAGER_SCHEMA: Final = vol.Schema(
+    {vol.Required("action"): vol.In(["add", "remove", "import", "export", "clear_all"])}
+)
+_WEBHOOK_MANAGER_SCHEMA: Final = vol.Schema(
+    {vol.Required("action"): vol.In(["add", "remove", "test", "clear_all"])}
+)
+
 
 class TsuryPhoneConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for TsuryPhone."""
@@ -88,8 +96,13 @@ class TsuryPhoneConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             else:
                 return self.async_create_entry(title=info["title"], data=user_input)
 
+        data_schema = STEP_USER_DATA_SCHEMA
+        if user_input is not None:
+            # Keep what the user typed when re-showing the form after an error
+            data_schema = self.add_suggested_values_to_schema(data_schema, user_input)
+
         return self.async_show_form(
-            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+            step_id="user", data_schema=data_schema, errors=errors
         )
 
     async def async_step_zeroconf(
@@ -120,6 +133,10 @@ class TsuryPhoneConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
         await self.async_set_unique_id(f"{host}:{port}")
         self._abort_if_unique_id_configured()
 
+        # Entries are keyed by device ID, so a repeat announcement from a known
+        # host would otherwise fetch and parse the full config just to abort
+        self._async_abort_entries_match({CONF_HOST: host, CONF_PORT: port})
+
         # Store discovery info
         self.discovery_info = {
             CONF_HOST: host,
@@ -321,7 +338,7 @@ class TsuryPhoneOptionsFlow(config_entries.OptionsFlow):
                 }
 
                 await self.coordinator.api_client.set_audio_config(audio_config)
-                await self.coordinator.async_request_refresh()
+                await self.coordinator.async_refresh_if_disconnected()
 
                 return self.async_create_entry(title="", data={})
 
@@ -361,7 +378,7 @@ class TsuryPhoneOptionsFlow(config_entries.OptionsFlow):
                     )
 
                 await self.coordinator.api_client.set_dnd(dnd_config)
-                await self.coordinator.async_request_refresh()
+                await self.coordinator.async_refresh_if_disconnected()
 
                 return self.async_create_entry(title="", data={})
 
@@ -416,7 +433,7 @@ class TsuryPhoneOptionsFlow(config_entries.OptionsFlow):
                     )
 
                 await self.coordinator.api_client.set_ring_pattern(pattern)
-                await self.coordinator.async_request_refresh()
+                await self.coordinator.async_refresh_if_disconnected()
 
                 return self.async_create_entry(title="", data={})
 
@@ -588,14 +605,7 @@ class TsuryPhoneOptionsFlow(config_entries.OptionsFlow):
                 return await self.async_step_quick_dial_clear()
 
         return self.async_show_form(
-            step_id="quick_dial_manager",
-            data_schema=vol.Schema(
-                {
-                    vol.Required("action"): vol.In(
-                        ["add", "remove", "import", "export", "clear_all"]
-                    )
-                }
-            ),
+            step_id="quick_dial_manager", data_schema=_LIST_MANAGER_SCHEMA
         )
 
     async def async_step_quick_dial_add(
@@ -609,7 +619,7 @@ class TsuryPhoneOptionsFlow(config_entries.OptionsFlow):
                 name = user_input["name"]
 
                 await self.coordinator.api_client.add_quick_dial(code, number, name)
-                await self.coordinator.async_request_refresh()
+                await self.coordinator.async_refresh_if_disconnected()
 
                 return self.async_create_entry(title="", data={})
 
@@ -639,7 +649,7 @@ class TsuryPhoneOptionsFlow(config_entries.OptionsFlow):
             try:
                 code = user_input["code"]
                 await self.coordinator.api_client.remove_quick_dial(code)
-                await self.coordinator.async_request_refresh()
+                await self.coordinator.async_refresh_if_disconnected()
 
                 return self.async_create_entry(title="", data={})
 
@@ -675,14 +685,7 @@ class TsuryPhoneOptionsFlow(config_entries.OptionsFlow):
                 return await self.async_step_blocked_clear()
 
         return self.async_show_form(
-            step_id="blocked_numbers_manager",
-            data_schema=vol.Schema(
-                {
-                    vol.Required("action"): vol.In(
-                        ["add", "remove", "import", "export", "clear_all"]
-                    )
-                }
-            ),
+            step_id="blocked_numbers_manager", data_schema=_LIST_MANAGER_SCHEMA
         )
 
     async def async_step_blocked_add(
@@ -695,7 +698,7 @@ class TsuryPhoneOptionsFlow(config_entries.OptionsFlow):
                 name = user_input["name"]
 
                 await self.coordinator.api_client.add_blocked_number(number, name)
-                await self.coordinator.async_request_refresh()
+                await self.coordinator.async_refresh_if_disconnected()
 
                 return self.async_create_entry(title="", data={})
 
@@ -755,7 +758,7 @@ class TsuryPhoneOptionsFlow(config_entries.OptionsFlow):
             try:
                 number = user_input["number"]
                 await self.coordinator.api_client.remove_blocked_number(number)
-                await self.coordinator.async_request_refresh()
+                await self.coordinator.async_refresh_if_disconnected()
 
                 return self.async_create_entry(title="", data={})
 
@@ -803,10 +806,7 @@ class TsuryPhoneOptionsFlow(config_entries.OptionsFlow):
                 return await self.async_step_webhook_clear()
 
         return self.async_show_form(
-            step_id="webhook_manager",
-            data_schema=vol.Schema(
-                {vol.Required("action"): vol.In(["add", "remove", "test", "clear_all"])}
-            ),
+            step_id="webhook_manager", data_schema=_WEBHOOK_MANAGER_SCHEMA
         )
 
     async def async_step_webhook_add(
@@ -820,7 +820,7 @@ class TsuryPhoneOptionsFlow(config_entries.OptionsFlow):
                 name = user_input.get("name")
 
                 await self.coordinator.api_client.add_webhook(url, events, name)
-                await self.coordinator.async_request_refresh()
+                await self.coordinator.async_refresh_if_disconnected()
 
                 return self.async_create_entry(title="", data={})
 
@@ -24,6 +24,7 @@ MDNS_DEVICE_TYPE: Final = "tsuryphone"
 WEBSOCKET_RECONNECT_DELAY: Final = 5000  # 5 seconds
 WEBSOCKET_MAX_BACKOFF: Final = 60000  # 60 seconds
 POLLING_FALLBACK_INTERVAL: Final = 30  # 30 seconds
+POLLING_WEBSOCKET_LIVE_INTERVAL: Final = 300  # 5 minutes, safety net while WS is up
 REFETCH_INTERVAL_DEFAULT: Final = 300  # 5 minutes
 
 # Event processing
@@ -66,6 +67,11 @@ class AppState(IntEnum):
     DIALING = 8
 
 
+INCOMING_CALL_STATES: Final = frozenset(
+    {AppState.INCOMING_CALL, AppState.INCOMING_CALL_RING}
+)
+
+
 class VolumeMode(StrEnum):
     """Audio routing modes exposed by the firmware."""
 
@@ -321,4 +327,4 @@ def is_dialing(app_state: AppState) -> bool:
 
 def is_incoming_call(app_state: AppState) -> bool:
     """Check if device has an incoming call."""
-    return app_state in (AppState.INCOMING_CALL, AppState.INCOMING_CALL_RING)
+    return app_state in INCOMING_CALL_STATES
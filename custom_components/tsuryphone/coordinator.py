@@ -8,7 +8,8 @@ import re
 import time
 from collections.abc import Mapping
 from datetime import datetime, timedelta
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Final
 
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
@@ -39,6 +40,7 @@ from .models import (
 from .const import (
     DOMAIN,
     POLLING_FALLBACK_INTERVAL,
+    POLLING_WEBSOCKET_LIVE_INTERVAL,
     REFETCH_INTERVAL_DEFAULT,
     AppState,
     EventCategory,
@@ -55,11 +57,50 @@ from .const import (
     HA_EVENT_SYSTEM,
     HA_EVENT_CONFIG_DELTA,
     HA_EVENT_DIAGNOSTIC_SNAPSHOT,
+    INCOMING_CALL_STATES,
     VolumeMode,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+_NON_ALNUM_RE: Final = re.compile(r"[^A-Z0-9]+")
+
+# AppState members keyed by their name with separators stripped ("INCOMINGCALL")
+_APP_STATES_BY_NORMALIZED_NAME: Final = {
+    _NON_ALNUM_RE.sub("", state.name): state for state in AppState
+}
+
+# Shared read-only fallback for optional mapping fields in event payloads
+_EMPTY_MAPPING: Final[Mapping[str, Any]] = MappingProxyType({})
+
+# Firmware audio/DND config keys -> AudioConfig/DNDConfig attribute names
+# (every value is a declared dataclass field, so lookups need no hasattr guard)
+_AUDIO_CONFIG_FIELDS: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "earpieceVolume": "earpiece_volume",
+        "earpieceGain": "earpiece_gain",
+        "speakerVolume": "speaker_volume",
+        "speakerGain": "speaker_gain",
+    }
+)
+_DND_CONFIG_FIELDS: Final[Mapping[str, str]] = MappingProxyType(
+    {
+        "force": "force",
+        "scheduled": "scheduled",
+        "startHour": "start_hour",
+        "startMinute": "start_minute",
+        "endHour": "end_hour",
+        "endMinute": "end_minute",
+    }
+)
+_DND_BOOL_FIELDS: Final = frozenset({"force", "scheduled"})
+
+# States from which a transition to idle is reported by call events instead
+_CALL_IN_PROGRESS_STATES: Final = INCOMING_CALL_STATES | {AppState.IN_CALL}
+
+# Event categories that always trigger a device state backup
+_STATE_BACKUP_CATEGORIES: Final = frozenset({"config", "system"})
+
 
 class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
     """Class to manage fetching data from the TsuryPhone device."""
@@ -101,6 +142,14 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
         self._pending_call_starts: dict[str, dict[str, Any]] = {}  # Key: call number
         self._recent_blocked_calls: dict[str, float] = {}
         self._call_state_dirty: bool = False
+        self._call_history_dirty: bool = False
+        # Listener broadcast deferred to the end of the current event burst
+        self._listener_update_handle: asyncio.Handle | None = None
+
+        # Config payload fetched during entry setup, reused by the first refresh
+        self._pending_config_response: dict[str, Any] | None = None
+        # Diagnostics fetch shared by overlapping refresh requests
+        self._diagnostics_task: asyncio.Task | None = None
 
         # Timers and intervals
         self._refetch_timer: Any = None
@@ -335,7 +384,7 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
         if changed and hasattr(state, "restored"):
             setattr(state, "restored", False)
 
-        if changed:
+        if changed and _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
                 "Diagnostics metrics applied: total=%s in=%s out=%s blocked=%s talk=%s uptime=%s heap=%s rssi=%s",
                 state.stats.calls_total,
@@ -449,19 +498,26 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
             timedelta(minutes=REFETCH_INTERVAL_DEFAULT),
         )
 
+    def seed_config_response(self, config_response: dict[str, Any]) -> None:
+        """Let the next refresh reuse a config response fetched during setup."""
+        self._pending_config_response = config_response
+
     async def _async_update_data(self) -> TsuryPhoneState:
         """Fetch data from API (used for polling fallback)."""
 
         try:
             state = self._ensure_state()
             
-            # Get current configuration and state
-            config_response = await self.api_client.get_tsuryphone_config()
+            # Get current configuration and state (setup may have fetched it already)
+            config_response = self._pending_config_response
+            self._pending_config_response = None
+            if config_response is None:
+                config_response = await self.api_client.get_tsuryphone_config()
 
             if not config_response.get("success"):
                 raise UpdateFailed("Device returned error response")
 
-            device_data = config_response.get("data", {})
+            device_data = config_response.get("data", _EMPTY_MAPPING)
 
             # Update state from device response
             await self._update_state_from_device_data(device_data)
@@ -485,17 +541,41 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
                 await self._resilience.handle_api_error(error_type, err)
             raise UpdateFailed(f"Error communicating with device: {err}") from err
 
-    async def async_refresh_diagnostics(self) -> None:
-        """Fetch diagnostics snapshot and apply metrics."""
+    async def async_refresh_diagnostics(self, *, raise_on_error: bool = False) -> None:
+        """Fetch diagnostics snapshot and apply metrics.
+
+        Fetch failures are logged, or re-raised when raise_on_error is set so
+        user-initiated refreshes can report them.
+        """
+        # Setup and the refresh button can overlap; join the fetch in flight
+        if self._diagnostics_task is None:
+            self._diagnostics_task = self.hass.async_create_task(
+                self._async_fetch_diagnostics()
+            )
+            self._diagnostics_task.add_done_callback(self._clear_diagnostics_task)
 
         try:
-            response = await self.api_client.get_diagnostics()
+            # A cancelled caller must not cancel the fetch the others joined
+            await asyncio.shield(self._diagnostics_task)
         except TsuryPhoneAPIError as err:
+            if raise_on_error:
+                raise
             _LOGGER.warning("Failed to fetch diagnostics snapshot: %s", err)
-            return
         except Exception as err:  # noqa: BLE001
+            if raise_on_error:
+                raise
             _LOGGER.error("Unexpected error fetching diagnostics snapshot: %s", err)
-            return
+
+    @callback
+    def _clear_diagnostics_task(self, task: asyncio.Task) -> None:
+        """Allow the next diagnostics refresh to start a new fetch."""
+        if self._diagnostics_task is task:
+            self._diagnostics_task = None
+
+    async def _async_fetch_diagnostics(self) -> None:
+        """Fetch the diagnostics snapshot once and apply its metrics."""
+        # Errors propagate to every joined caller; each decides how to report
+        response = await self.api_client.get_diagnostics()
 
         diagnostics_payload: Mapping[str, Any] | None = None
 
@@ -513,10 +593,8 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
         if self._apply_diagnostics_metrics(diagnostics_payload):
             self.async_set_updated_data(self.data)
             if self._storage_cache:
-                self.hass.async_create_task(
-                    self._storage_cache.async_save_device_state(
-                        self.data, self._send_mode_enabled
-                    )
+                self._storage_cache.async_schedule_save_device_state(
+                    self.data, self._send_mode_enabled
                 )
 
     async def _start_websocket(self) -> None:
@@ -545,8 +623,10 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
     async def _stop_websocket(self) -> None:
         """Stop WebSocket connection."""
         if self._websocket_client:
-            await self._websocket_client.stop()
+            # Detach first so the disconnect callback knows this is a shutdown
+            websocket_client = self._websocket_client
             self._websocket_client = None
+            await websocket_client.stop()
 
     @callback
     def _handle_websocket_event(self, event: TsuryPhoneEvent) -> None:
@@ -560,6 +640,28 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
         # Fallback to direct processing if resilience not available
         self._process_event_directly(event)
 
+    @callback
+    def _schedule_listener_update(self) -> None:
+        """Schedule a single listener update for all events in this loop pass."""
+        if self._listener_update_handle is None:
+            self._listener_update_handle = self.hass.loop.call_soon(
+                self._flush_listener_update
+            )
+
+    @callback
+    def _flush_listener_update(self) -> None:
+        """Push the accumulated event state to listeners and notifications."""
+        self._listener_update_handle = None
+        if self.data is None:
+            return
+        self.async_set_updated_data(self.data)
+
+        # Phase P5: Check and update notifications after event processing
+        if self._notification_manager:
+            self.hass.async_create_task(
+                self._notification_manager.async_check_and_update_notifications()
+            )
+
     def _handle_websocket_state_change(self, state: str, stats: dict[str, Any]) -> None:
         """React to WebSocket connection state changes."""
 
@@ -578,6 +680,8 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
             self._websocket_connection_seen = True
             self._last_websocket_disconnect = 0
             self._ensure_state().connected = True
+            # Events keep state current; polling only needs to catch missed deltas
+            self.update_interval = timedelta(seconds=POLLING_WEBSOCKET_LIVE_INTERVAL)
             _LOGGER.debug(
                 "WebSocket connection state: %s (seq=%s)",
                 state,
@@ -588,6 +692,10 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
         if state == "disconnected":
             self._last_websocket_disconnect = time.time()
             _LOGGER.debug("WebSocket disconnected (stats: %s)", stats)
+            # Fall back to regular polling until the event stream is back
+            self.update_interval = timedelta(seconds=POLLING_FALLBACK_INTERVAL)
+            if self._websocket_client is not None:
+                self.hass.async_create_task(self.async_request_refresh())
 
     async def _process_event_with_resilience(self, event: TsuryPhoneEvent) -> None:
         """Process event through resilience manager."""
@@ -615,7 +723,7 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
         self.data.connected = True
         self.data.last_seen = time.time()
         # Check for reboot detection
-        if hasattr(event, "_reboot_detected") and event._reboot_detected:
+        if event.reboot_detected:
             self._handle_reboot_detection(event)
 
         # Update last sequence
@@ -645,32 +753,30 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
         if self._call_state_dirty:
             self._mark_call_state_changed()
 
-        # Update coordinator data and notify listeners
-        self.async_set_updated_data(self.data)
+        # Notify listeners (and re-check notifications) once per burst of events
+        # rather than once per event
+        self._schedule_listener_update()
         # Reset dirty flag after pushing updates
         self._call_state_dirty = False
 
-        # Phase P5: Check and update notifications after event processing
-        if self._notification_manager:
-            self.hass.async_create_task(
-                self._notification_manager.async_check_and_update_notifications()
-            )
-
-        # Phase P7: Update storage cache
+        # Phase P7: Update storage cache (call history only when an entry was added)
         if self._storage_cache:
-            self.hass.async_create_task(
-                self._storage_cache.async_save_call_history(
+            if self._call_history_dirty:
+                self._call_history_dirty = False
+                self._storage_cache.async_schedule_save_call_history(
                     self.data.call_history or []
                 )
-            )
             # Save device state backup periodically (every 10 events or important changes)
-            if event.seq % 10 == 0 or event.category in ["config", "system"]:
-                self.hass.async_create_task(
-                    self._storage_cache.async_save_device_state(
-                        self.data, self._send_mode_enabled
-                    )
+            if event.seq % 10 == 0 or event.category in _STATE_BACKUP_CATEGORIES:
+                self._storage_cache.async_schedule_save_device_state(
+                    self.data, self._send_mode_enabled
                 )
 
+    def _add_call_history_entry(self, entry: CallHistoryEntry) -> None:
+        """Append a call history entry and mark the history for persisting."""
+        self.data.add_call_history_entry(entry)
+        self._call_history_dirty = True
+
     def _handle_call_event(self, event: TsuryPhoneEvent) -> None:
         """Handle call-related events."""
         if event.event == "start":
@@ -956,7 +1062,7 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
             entry.name = caller_name
             entry.reason = call_info.result or entry.reason
             entry.call_type = call_info.call_type or entry.call_type
-            self.data.add_call_history_entry(entry)
+            self._add_call_history_entry(entry)
         else:
             _LOGGER.debug("Synthesizing call start for end-only event")
             caller_name = call_info.name
@@ -977,15 +1083,7 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
                 duration_ms=call_info.duration_ms,
                 reason=call_info.result or None,
             )
-            self.data.add_call_history_entry(history_entry)
-
-        # Persist call history immediately after adding entry
-        if self._storage_cache:
-            # Copy the list immediately to prevent race conditions
-            history_to_save = list(self.data.call_history or [])
-            self.hass.async_create_task(
-                self._storage_cache.async_save_call_history(history_to_save)
-            )
+            self._add_call_history_entry(history_entry)
 
         # Clear remaining current call state
         if self._reset_current_call_state(number=number):
@@ -1017,15 +1115,7 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
             name=caller_name,
         )
 
-        self.data.add_call_history_entry(history_entry)
-
-        # Persist call history immediately after adding blocked entry
-        if self._storage_cache:
-            # Copy the list immediately to prevent race conditions
-            history_to_save = list(self.data.call_history or [])
-            self.hass.async_create_task(
-                self._storage_cache.async_save_call_history(history_to_save)
-            )
+        self._add_call_history_entry(history_entry)
 
         # Update blocked call statistics
         self.data.stats.calls_blocked += 1
@@ -1581,7 +1671,7 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
             ):
                 self._flag_call_state_dirty()
 
-        if new_state in (AppState.INCOMING_CALL, AppState.INCOMING_CALL_RING):
+        if new_state in INCOMING_CALL_STATES:
             if self._setattr_if_changed(self.data.current_call, "is_incoming", True):
                 self._flag_call_state_dirty()
         elif new_state == AppState.DIALING:
@@ -1608,11 +1698,7 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
         if (
             previous_state
             and new_state
-            and previous_state
-            in (
-                AppState.INCOMING_CALL,
-                AppState.INCOMING_CALL_RING,
-            )
+            and previous_state in INCOMING_CALL_STATES
             and new_state == AppState.IDLE
         ):
             self._detect_missed_call(event)
@@ -1625,7 +1711,7 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
         # Reset call timer when transitioning from Dialing to In Call
         # This ensures duration starts counting from when call is answered, not from dialing
         if previous_state == AppState.DIALING and new_state == AppState.IN_CALL:
-            _LOGGER.info(
+            _LOGGER.debug(
                 "Call transitioned from Dialing to In Call - resetting call timer"
             )
             self._start_call_timer()
@@ -1686,31 +1772,32 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
         has_current_snapshot = isinstance(current_snapshot, dict)
 
         # Log the raw event data to see what firmware is actually sending
-        _LOGGER.info(
-            "=== CALL_INFO EVENT (seq=%d) ===\n"
-            "  currentCall snapshot: %s\n"
-            "  waitingCall snapshot: %s\n"
-            "  currentCallNumber: %s\n"
-            "  currentCallName: %s\n"
-            "  waitingCallNumber: %s\n"
-            "  waitingCallName: %s\n"
-            "  Current state BEFORE update: active=%s (callId=%d), waiting=%s (callId=%d)",
-            event.seq,
-            current_snapshot if has_current_snapshot else "NONE",
-            (
-                event.data.get("waitingCall")
-                if isinstance(event.data.get("waitingCall"), dict)
-                else "NONE"
-            ),
-            event.data.get("currentCallNumber", "NONE"),
-            event.data.get("currentCallName", "NONE"),
-            event.data.get("waitingCallNumber", "NONE"),
-            event.data.get("waitingCallName", "NONE"),
-            self.data.current_call.number,
-            self.data.current_call.call_id,
-            self.data.waiting_call.number,
-            self.data.waiting_call.call_id,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "=== CALL_INFO EVENT (seq=%d) ===\n"
+                "  currentCall snapshot: %s\n"
+                "  waitingCall snapshot: %s\n"
+                "  currentCallNumber: %s\n"
+                "  currentCallName: %s\n"
+                "  waitingCallNumber: %s\n"
+                "  waitingCallName: %s\n"
+                "  Current state BEFORE update: active=%s (callId=%d), waiting=%s (callId=%d)",
+                event.seq,
+                current_snapshot if has_current_snapshot else "NONE",
+                (
+                    event.data.get("waitingCall")
+                    if isinstance(event.data.get("waitingCall"), dict)
+                    else "NONE"
+                ),
+                event.data.get("currentCallNumber", "NONE"),
+                event.data.get("currentCallName", "NONE"),
+                event.data.get("waitingCallNumber", "NONE"),
+                event.data.get("waitingCallName", "NONE"),
+                self.data.current_call.number,
+                self.data.current_call.call_id,
+                self.data.waiting_call.number,
+                self.data.waiting_call.call_id,
+            )
 
         if has_current_snapshot:
             current_info = self._call_info_from_snapshot(
@@ -1738,14 +1825,15 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
                 current_info.end_received_ts = self.data.current_call.end_received_ts
 
             # Log call leg information for debugging
-            _LOGGER.debug(
-                "Processing currentCall snapshot: number=%s, name=%s, callId=%d, leg=%s, direction=%s",
-                current_info.number,
-                current_info.name,
-                current_info.call_id,
-                current_info.leg_label,
-                current_info.direction,
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Processing currentCall snapshot: number=%s, name=%s, callId=%d, leg=%s, direction=%s",
+                    current_info.number,
+                    current_info.name,
+                    current_info.call_id,
+                    current_info.leg_label,
+                    current_info.direction,
+                )
 
             # Detect if call legs have been swapped
             old_active_id = self.data.current_call.call_id
@@ -1786,7 +1874,7 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
                             self._call_start_monotonic,
                         )
                 else:
-                    _LOGGER.info(
+                    _LOGGER.debug(
                         "Active call changed: callId %d -> %d (number: %s -> %s)",
                         old_active_id,
                         current_info.call_id,
@@ -1796,7 +1884,7 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
 
             if self._apply_call_info(self.data.current_call, current_info):
                 call_state_changed = True
-                _LOGGER.info(
+                _LOGGER.debug(
                     "Current active call updated: %s (%s) [%s] - callId=%d",
                     current_info.number,
                     current_info.name,
@@ -1975,18 +2063,19 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
                 waiting_info.end_received_ts = self.data.waiting_call.end_received_ts
 
             # Log waiting call leg information for debugging
-            _LOGGER.debug(
-                "Processing waitingCall snapshot: number=%s, name=%s, callId=%d, leg=%s, isOnHold=%s",
-                waiting_info.number,
-                waiting_info.name,
-                waiting_info.call_id,
-                waiting_info.leg_label,
-                waiting_info.is_on_hold,
-            )
+            if _LOGGER.isEnabledFor(logging.DEBUG):
+                _LOGGER.debug(
+                    "Processing waitingCall snapshot: number=%s, name=%s, callId=%d, leg=%s, isOnHold=%s",
+                    waiting_info.number,
+                    waiting_info.name,
+                    waiting_info.call_id,
+                    waiting_info.leg_label,
+                    waiting_info.is_on_hold,
+                )
 
             if self._apply_call_info(self.data.waiting_call, waiting_info):
                 call_state_changed = True
-                _LOGGER.info(
+                _LOGGER.debug(
                     "Current waiting call updated: %s (%s) [onHold=%s] - callId=%d",
                     waiting_info.number,
                     waiting_info.name,
@@ -2100,22 +2189,23 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
             self._flag_call_state_dirty()
 
         # Log final state after update
-        _LOGGER.info(
-            "=== CALL_INFO FINAL STATE (seq=%d) ===\n"
-            "  Active call: %s (%s) [callId=%d, dir=%s]\n"
-            "  Waiting call: %s (%s) [callId=%d, onHold=%s]\n"
-            "  State changed: %s",
-            event.seq,
-            self.data.current_call.number,
-            self.data.current_call.name,
-            self.data.current_call.call_id,
-            self.data.current_call.direction,
-            self.data.waiting_call.number,
-            self.data.waiting_call.name,
-            self.data.waiting_call.call_id,
-            self.data.waiting_call.is_on_hold,
-            call_state_changed,
-        )
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "=== CALL_INFO FINAL STATE (seq=%d) ===\n"
+                "  Active call: %s (%s) [callId=%d, dir=%s]\n"
+                "  Waiting call: %s (%s) [callId=%d, onHold=%s]\n"
+                "  State changed: %s",
+                event.seq,
+                self.data.current_call.number,
+                self.data.current_call.name,
+                self.data.current_call.call_id,
+                self.data.current_call.direction,
+                self.data.waiting_call.number,
+                self.data.waiting_call.name,
+                self.data.waiting_call.call_id,
+                self.data.waiting_call.is_on_hold,
+                call_state_changed,
+            )
 
     def _handle_stats_update(self, event: TsuryPhoneEvent) -> None:
         """Handle statistics update."""
@@ -2273,56 +2363,39 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
     def _apply_config_change(self, key: str, value: Any) -> None:
         """Apply a single configuration change."""
         _LOGGER.debug("Applying config change: %s = %s", key, value)
+        section, _, field = key.partition(".")
 
         # Map configuration keys to state fields
         if key == "ring.pattern":
             self.data.ring_pattern = str(value)
-        elif key.startswith("audio."):
-            # Audio configuration changes
-            audio_field = key.split(".", 1)[1]
-            # Map API field names to model field names
-            field_mapping = {
-                "earpieceVolume": "earpiece_volume",
-                "earpieceGain": "earpiece_gain",
-                "speakerVolume": "speaker_volume",
-                "speakerGain": "speaker_gain",
-            }
-            model_field = field_mapping.get(audio_field, audio_field)
+        elif section == "audio":
+            # Audio configuration changes (firmware field names -> model fields)
+            model_field = _AUDIO_CONFIG_FIELDS.get(field, field)
             if hasattr(self.data.audio_config, model_field):
                 setattr(self.data.audio_config, model_field, value)
-        elif key.startswith("dnd."):
+        elif section == "dnd":
             # DND configuration changes
-            dnd_field = key.split(".", 1)[1]
-            field_mapping = {
-                "force": "force",
-                "scheduled": "scheduled",
-                "startHour": "start_hour",
-                "startMinute": "start_minute",
-                "endHour": "end_hour",
-                "endMinute": "end_minute",
-            }
-            model_field = field_mapping.get(dnd_field, dnd_field)
+            model_field = _DND_CONFIG_FIELDS.get(field, field)
             if hasattr(self.data.dnd_config, model_field):
                 setattr(self.data.dnd_config, model_field, value)
                 # Update active DND status if needed
-                if dnd_field == "force":
+                if field == "force":
                     forced = self._coerce_bool(
                         value,
                         "config.delta.dnd.force",
                         default=self.data.dnd_active,
                     )
                     self.data.dnd_active = forced or self.data.dnd_active
-        elif key.startswith("dialing."):
-            dial_field = key.split(".", 1)[1]
-            if dial_field == "defaultCode":
+        elif section == "dialing":
+            if field == "defaultCode":
                 self._update_default_dialing_metadata(code=value)
-            elif dial_field == "defaultPrefix":
+            elif field == "defaultPrefix":
                 self._update_default_dialing_metadata(prefix=value)
             else:
                 _LOGGER.debug("Unhandled dialing config delta key: %s", key)
-        elif key.startswith("quick_dial."):
+        elif section == "quick_dial":
             # Quick dial list changes
-            action = key.split(".", 1)[1]
+            action = field
             if action == "add" and isinstance(value, dict):
                 # Add new quick dial entry
                 try:
@@ -2360,9 +2433,9 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
                         q for q in self.data.quick_dials if q.id != entry_id
                     ]
                     self._ensure_quick_dial_selection()
-        elif key.startswith("blocked."):
+        elif section == "blocked":
             # Blocked numbers list changes
-            action = key.split(".", 1)[1]
+            action = field
             if action == "add" and isinstance(value, dict):
                 try:
                     # Firmware sends normalized number in "number" field
@@ -2393,9 +2466,9 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
                     b for b in self.data.blocked_numbers if b.id != value
                 ]
                 self._ensure_blocked_selection()
-        elif key.startswith("webhook."):
+        elif section == "webhook":
             # Webhook configuration changes
-            action = key.split(".", 1)[1]
+            action = field
             if action == "add" and isinstance(value, dict):
                 try:
                     raw_events = value.get("events") or value.get("eventTypes") or []
@@ -2424,9 +2497,9 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
                 # Remove webhook by code
                 self.data.webhooks = [w for w in self.data.webhooks if w.code != value]
                 self._ensure_webhook_selection()
-        elif key.startswith("priority."):
+        elif section == "priority":
             # Priority callers list changes (firmware emits priority.add / priority.remove)
-            action = key.split(".", 1)[1]
+            action = field
             if action == "add" and isinstance(value, dict):
                 try:
                     # Firmware sends normalized number in "number" field
@@ -2837,14 +2910,10 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
             # Audio config
             audio = data.get("audioConfig") or config_section.get("audio") or {}
             if audio:
-                for fw_key, model_attr in {
-                    "earpieceVolume": "earpiece_volume",
-                    "earpieceGain": "earpiece_gain",
-                    "speakerVolume": "speaker_volume",
-                    "speakerGain": "speaker_gain",
-                }.items():
-                    if fw_key in audio and hasattr(self.data.audio_config, model_attr):
-                        setattr(self.data.audio_config, model_attr, audio[fw_key])
+                audio_config = self.data.audio_config
+                for fw_key, model_attr in _AUDIO_CONFIG_FIELDS.items():
+                    if fw_key in audio:
+                        setattr(audio_config, model_attr, audio[fw_key])
 
             # DND config
             dnd_sources: tuple[dict[str, Any] | None, ...] = (
@@ -2863,20 +2932,12 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
             )
             dnd = next((section for section in dnd_sources if section), None)
             if dnd:
-                mapping = {
-                    "force": "force",
-                    "scheduled": "scheduled",
-                    "startHour": "start_hour",
-                    "startMinute": "start_minute",
-                    "endHour": "end_hour",
-                    "endMinute": "end_minute",
-                }
-                for fw_key, attr in mapping.items():
-                    if fw_key not in dnd or not hasattr(self.data.dnd_config, attr):
+                for fw_key, attr in _DND_CONFIG_FIELDS.items():
+                    if fw_key not in dnd:
                         continue
 
                     value = dnd[fw_key]
-                    if attr in {"force", "scheduled"}:
+                    if attr in _DND_BOOL_FIELDS:
                         coerced = self._coerce_bool(
                             value,
                             f"snapshot.dnd.{fw_key}",
@@ -2922,7 +2983,7 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
         self._pending_call_starts.clear()
 
         # Schedule refetch (rate limited)
-        current_time = time.time()
+        current_time = time.monotonic()
         if current_time - self._last_refetch_time > 10:  # Max once per 10s
             self.hass.async_create_task(self._refetch_after_reboot())
             self._last_refetch_time = current_time
@@ -3165,7 +3226,7 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
             name=caller_name,
         )
 
-        self.data.add_call_history_entry(history_entry)
+        self._add_call_history_entry(history_entry)
 
         if self._update_last_call_info(
             number,
@@ -3211,7 +3272,7 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
             name=caller_name,
         )
 
-        self.data.add_call_history_entry(history_entry)
+        self._add_call_history_entry(history_entry)
 
         if self._update_last_call_info(
             number,
@@ -3410,7 +3471,7 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
             elif event.event == PhoneStateEvent.IDLE:
                 # Check if this was a disconnect or device state change
                 old_state = self.data.previous_app_state
-                if old_state in [AppState.RINGING, AppState.IN_CALL]:
+                if old_state in _CALL_IN_PROGRESS_STATES:
                     # This might be a missed call or call end - handled by call events
                     pass
                 elif not self.data.connected:
@@ -3441,7 +3502,7 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
         # Phase P5: Fire DND and maintenance mode triggers
         elif event.category == EventCategory.CONFIG:
             config_section = event.data.get("section", "")
-            changes = event.data.get("changes", {})
+            changes = event.data.get("changes", _EMPTY_MAPPING)
 
             # Check for DND changes
             if config_section == "dnd" or "dnd" in changes:
@@ -3536,11 +3597,7 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
             while True:
                 await asyncio.sleep(1)
                 if self._call_start_monotonic > 0:
-                    # Update call duration in state (triggers entity updates)
-                    current_duration = int(
-                        time.monotonic() - self._call_start_monotonic
-                    )
-                    # Duration will be read by call duration sensor
+                    # Duration is derived on read by the call duration sensor
                     self.async_set_updated_data(self.data)
         except asyncio.CancelledError:
             pass
@@ -3576,6 +3633,23 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
         # Trigger update so entities can react
         self.async_set_updated_data(self.data)
 
+    @property
+    def websocket_connected(self) -> bool:
+        """Return True when the WebSocket event stream is live."""
+        return self._websocket_client is not None and self._websocket_client.connected
+
+    async def async_refresh_if_disconnected(self) -> None:
+        """Refresh after a device mutation only when no config delta will arrive.
+
+        While the WebSocket is connected the firmware pushes a config.delta
+        event for every config change, so a full re-fetch would be redundant;
+        listeners are still notified so optimistic local updates show at once.
+        """
+        if self.websocket_connected:
+            self.async_update_listeners()
+        else:
+            await self.async_request_refresh()
+
     async def _update_state_from_device_data(self, device_data: dict[str, Any]) -> None:
         """Update state model from device API response."""
         # This method would parse the full device response and update self.data
@@ -3614,7 +3688,7 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
             if isinstance(phone_data, dict) and isinstance(
                 phone_data.get("dialing"), dict
             ):
-                dialing_info = phone_data.get("dialing", {})
+                dialing_info = phone_data["dialing"]
                 self._update_default_dialing_metadata(
                     code=dialing_info.get("defaultCode"),
                     prefix=dialing_info.get("defaultPrefix"),
@@ -3895,7 +3969,7 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
                     default=self.data.maintenance_mode,
                 )
             elif isinstance(phone_data.get("maintenance"), dict):
-                maintenance_info = phone_data.get("maintenance", {})
+                maintenance_info = phone_data["maintenance"]
                 if "enabled" in maintenance_info:
                     self.data.maintenance_mode = self._coerce_bool(
                         maintenance_info["enabled"],
@@ -4026,16 +4100,10 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
             or device_data.get("audio")
         )
         if isinstance(audio_section, dict):
-            for fw_key, model_attr in {
-                "earpieceVolume": "earpiece_volume",
-                "earpieceGain": "earpiece_gain",
-                "speakerVolume": "speaker_volume",
-                "speakerGain": "speaker_gain",
-            }.items():
-                if fw_key in audio_section and hasattr(
-                    self.data.audio_config, model_attr
-                ):
-                    setattr(self.data.audio_config, model_attr, audio_section[fw_key])
+            audio_config = self.data.audio_config
+            for fw_key, model_attr in _AUDIO_CONFIG_FIELDS.items():
+                if fw_key in audio_section:
+                    setattr(audio_config, model_attr, audio_section[fw_key])
 
         dnd_sources: tuple[dict[str, Any] | None, ...] = (
             (
@@ -4061,19 +4129,12 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
         )
         dnd_section = next((section for section in dnd_sources if section), None)
         if dnd_section:
-            for fw_key, attr in {
-                "force": "force",
-                "scheduled": "scheduled",
-                "startHour": "start_hour",
-                "startMinute": "start_minute",
-                "endHour": "end_hour",
-                "endMinute": "end_minute",
-            }.items():
-                if fw_key not in dnd_section or not hasattr(self.data.dnd_config, attr):
+            for fw_key, attr in _DND_CONFIG_FIELDS.items():
+                if fw_key not in dnd_section:
                     continue
 
                 value = dnd_section[fw_key]
-                if attr in {"force", "scheduled"}:
+                if attr in _DND_BOOL_FIELDS:
                     coerced = self._coerce_bool(
                         value,
                         f"config.dnd.{fw_key}",
@@ -4119,7 +4180,7 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
                 default=self.data.maintenance_mode,
             )
         elif isinstance(device_data.get("maintenance"), dict):
-            maintenance_info = device_data.get("maintenance", {})
+            maintenance_info = device_data["maintenance"]
             if "enabled" in maintenance_info:
                 self.data.maintenance_mode = self._coerce_bool(
                     maintenance_info["enabled"],
@@ -4365,11 +4426,10 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
                     self._log_invalid_app_state(value, source)
                     return None
 
-            normalized = re.sub(r"[^A-Z0-9]+", "", candidate.upper())
-            for state in AppState:
-                state_normalized = re.sub(r"[^A-Z0-9]+", "", state.name.upper())
-                if normalized == state_normalized:
-                    return state
+            normalized = _NON_ALNUM_RE.sub("", candidate.upper())
+            state = _APP_STATES_BY_NORMALIZED_NAME.get(normalized)
+            if state is not None:
+                return state
 
         if value is not None:
             self._log_invalid_app_state(value, source)
@@ -4517,6 +4577,16 @@ class TsuryPhoneDataUpdateCoordinator(DataUpdateCoordinator[TsuryPhoneState]):
         # Stop call timer
         self._stop_call_timer()
 
+        # Shielded from its callers, so the diagnostics fetch is stopped here
+        if self._diagnostics_task:
+            self._diagnostics_task.cancel()
+            self._diagnostics_task = None
+
+        # Drop any listener update still pending from the last event burst
+        if self._listener_update_handle:
+            self._listener_update_handle.cancel()
+            self._listener_update_handle = None
+
         # Cancel refetch timer
         if self._refetch_timer:
             self._refetch_timer()
@@ -52,6 +52,19 @@ TRIGGER_TYPES = [
     TRIGGER_DEVICE_REBOOTED,
 ]
 
+# Trigger types that carry call details (number filter, call payload)
+CALL_TRIGGER_TYPES = frozenset(
+    {
+        TRIGGER_INCOMING_CALL,
+        TRIGGER_CALL_ANSWERED,
+        TRIGGER_CALL_ENDED,
+        TRIGGER_MISSED_CALL,
+    }
+)
+CONNECTION_TRIGGER_TYPES = frozenset(
+    {TRIGGER_DEVICE_CONNECTED, TRIGGER_DEVICE_DISCONNECTED}
+)
+
 TRIGGER_SCHEMA = DEVICE_TRIGGER_BASE_SCHEMA.extend(
     {
         vol.Required(CONF_TYPE): vol.In(TRIGGER_TYPES),
@@ -240,12 +253,7 @@ async def async_get_trigger_capabilities(
     fields = {}
     
     # Add number filter for call-related triggers
-    if trigger_type in [
-        TRIGGER_INCOMING_CALL,
-        TRIGGER_CALL_ANSWERED,
-        TRIGGER_CALL_ENDED,
-        TRIGGER_MISSED_CALL,
-    ]:
+    if trigger_type in CALL_TRIGGER_TYPES:
         fields["number"] = {
             "selector": {"text": {"type": "tel"}},
             "name": "Phone Number",
@@ -282,12 +290,7 @@ def get_trigger_event_data_schema(trigger_type: str) -> dict[str, Any]:
         "timestamp": str,
     }
     
-    if trigger_type in [
-        TRIGGER_INCOMING_CALL,
-        TRIGGER_CALL_ANSWERED,
-        TRIGGER_CALL_ENDED,
-        TRIGGER_MISSED_CALL,
-    ]:
+    if trigger_type in CALL_TRIGGER_TYPES:
         base_schema.update({
             "number": str,
             "name": str,
@@ -306,7 +309,7 @@ def get_trigger_event_data_schema(trigger_type: str) -> dict[str, Any]:
             "changes": dict,
         })
     
-    elif trigger_type in [TRIGGER_DEVICE_CONNECTED, TRIGGER_DEVICE_DISCONNECTED]:
+    elif trigger_type in CONNECTION_TRIGGER_TYPES:
         base_schema.update({
             "previous_state": str,
             "new_state": str,
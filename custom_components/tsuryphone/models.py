@@ -10,7 +10,13 @@ from datetime import datetime
 
 from homeassistant.util import dt as dt_util
 
-from .const import AppState, EventCategory, INTEGRATION_EVENT_SCHEMA_VERSION, VolumeMode
+from .const import (
+    AppState,
+    EventCategory,
+    INCOMING_CALL_STATES,
+    INTEGRATION_EVENT_SCHEMA_VERSION,
+    VolumeMode,
+)
 from .dialing import DialingContext
 
 
@@ -197,7 +203,7 @@ class DeviceStats:
     rssi_dbm: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class CallHistoryEntry:
     """Single call history entry.
     
@@ -354,7 +360,7 @@ class TsuryPhoneState:
     @property
     def is_incoming_call(self) -> bool:
         """True if device has an incoming call."""
-        return self.app_state in (AppState.INCOMING_CALL, AppState.INCOMING_CALL_RING)
+        return self.app_state in INCOMING_CALL_STATES
 
     @property
     def is_dialing(self) -> bool:
@@ -412,7 +418,7 @@ class TsuryPhoneState:
         """Return the direction of the current call or dialing session."""
         if self.current_call.direction:
             return self.current_call.direction
-        if self.app_state in (AppState.INCOMING_CALL, AppState.INCOMING_CALL_RING):
+        if self.app_state in INCOMING_CALL_STATES:
             return "incoming"
         if self.app_state in (AppState.DIALING, AppState.IN_CALL):
             return "incoming" if self.current_call.is_incoming else "outgoing"
@@ -422,9 +428,10 @@ class TsuryPhoneState:
         """Add entry to call history with capacity management."""
         self.call_history.append(entry)
 
-        # Enforce capacity limit (newest entries kept)
-        if len(self.call_history) > self.call_history_capacity:
-            self.call_history = self.call_history[-self.call_history_capacity :]
+        # Enforce capacity limit (newest entries kept), trimming in place
+        overflow = len(self.call_history) - self.call_history_capacity
+        if overflow > 0:
+            del self.call_history[:overflow]
 
     def get_quick_dial_by_code(self, code: str) -> QuickDialEntry | None:
         """Find quick dial entry by code."""
@@ -462,7 +469,7 @@ class TsuryPhoneState:
         )
 
 
-@dataclass
+@dataclass(slots=True)
 class TsuryPhoneEvent:
     """Represents a device event from WebSocket or generated internally."""
 
@@ -475,6 +482,8 @@ class TsuryPhoneEvent:
     event: str
     data: dict[str, Any] = field(default_factory=dict)
     received_at: float = field(default_factory=time.time)
+    # Set by the resilience manager when the sequence drop looks like a reboot
+    reboot_detected: bool = False
 
     @classmethod
     def from_json(cls, data: dict[str, Any]) -> TsuryPhoneEvent:
@@ -5,8 +5,10 @@ from __future__ import annotations
 import asyncio
 import inspect
 import logging
+from collections.abc import Mapping
 from datetime import datetime, timedelta
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Final
 
 from homeassistant.components.persistent_notification import (
     DOMAIN as PERSISTENT_NOTIFICATION_DOMAIN,
@@ -28,6 +30,8 @@ from .models import TsuryPhoneState
 
 _LOGGER = logging.getLogger(__name__)
 
+_EMPTY_MAPPING: Final[Mapping[str, Any]] = MappingProxyType({})
+
 
 class TsuryPhoneNotificationManager:
     """Manage persistent notifications for TsuryPhone devices."""
@@ -43,6 +47,10 @@ class TsuryPhoneNotificationManager:
         # Track notification states to avoid spam
         self._notification_states: dict[str, dict[str, Any]] = {}
 
+        # Missed-call scan inputs from the last pass, and when its result expires
+        self._missed_calls_signature: tuple[int, int, int] | None = None
+        self._missed_calls_valid_until: datetime | None = None
+
     def _coerce_to_datetime_utc(self, value: Any) -> datetime | None:
         """Convert supported timestamp representations to an aware UTC datetime."""
         if value is None:
@@ -238,20 +246,48 @@ class TsuryPhoneNotificationManager:
         """Handle missed calls notifications."""
         notification_id = self.get_notification_id(NOTIFICATION_ID_MISSED_CALLS)
 
+        # Get last notified count to avoid repeat notifications
+        last_state = self._notification_states.get(
+            NOTIFICATION_ID_MISSED_CALLS, _EMPTY_MAPPING
+        )
+        last_notified_count = last_state.get("missed_calls_count", 0)
+
+        # Most events leave the history untouched; skip the rescan unless it
+        # changed or a counted missed call has since aged out of the window
+        history = state.call_history or []
+        now = dt_util.utcnow()
+        signature = (
+            len(history),
+            history[-1].seq if history else 0,
+            last_notified_count,
+        )
+        if signature == self._missed_calls_signature and (
+            self._missed_calls_valid_until is None
+            or now < self._missed_calls_valid_until
+        ):
+            return
+
         # Count recent missed calls (last 24 hours)
         missed_calls_count = 0
         recent_missed_calls = []
-
-        if state.call_history:
-            cutoff_time = dt_util.utcnow() - timedelta(hours=24)
-            for call in state.call_history:
-                if call.missed and call.timestamp and call.timestamp > cutoff_time:
+        oldest_counted: datetime | None = None
+
+        if history:
+            cutoff_time = now - timedelta(hours=24)
+            for call in history:
+                if not call.missed:
+                    continue
+                call_time = call.timestamp
+                if call_time and call_time > cutoff_time:
                     missed_calls_count += 1
                     recent_missed_calls.append(call)
+                    if oldest_counted is None or call_time < oldest_counted:
+                        oldest_counted = call_time
 
-        # Get last notified count to avoid repeat notifications
-        last_state = self._notification_states.get(NOTIFICATION_ID_MISSED_CALLS, {})
-        last_notified_count = last_state.get("missed_calls_count", 0)
+        self._missed_calls_signature = signature
+        self._missed_calls_valid_until = (
+            oldest_counted + timedelta(hours=24) if oldest_counted else None
+        )
 
         # Create/update notification if there are new missed calls
         if missed_calls_count > last_notified_count and missed_calls_count > 0:
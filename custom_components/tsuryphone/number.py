@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from typing import Any, Final
 
 from homeassistant.components.number import NumberEntity, NumberEntityDescription
 from homeassistant.config_entries import ConfigEntry
@@ -21,6 +21,9 @@ from .models import TsuryPhoneState
 
 _LOGGER = logging.getLogger(__name__)
 
+_EARPIECE_KEYS: Final = frozenset({"earpiece_volume", "earpiece_gain"})
+_SPEAKER_KEYS: Final = frozenset({"speaker_volume", "speaker_gain"})
+
 NUMBER_DESCRIPTIONS = (
     NumberEntityDescription(
         key="earpiece_volume",
@@ -150,8 +153,8 @@ class TsuryPhoneNumber(
             # Update local state optimistically
             self._update_local_state(int_value)
 
-            # Trigger coordinator update to get server confirmation
-            await self.coordinator.async_request_refresh()
+            # Server confirmation arrives as a config delta, or via refresh when offline
+            await self.coordinator.async_refresh_if_disconnected()
 
         except TsuryPhoneAPIError as err:
             raise HomeAssistantError(f"Failed to set {self.name}: {err}") from err
@@ -194,11 +197,11 @@ class TsuryPhoneNumber(
             attributes["restored"] = True
 
         # Add audio config context
-        if self.entity_description.key in ["earpiece_volume", "earpiece_gain"]:
+        if self.entity_description.key in _EARPIECE_KEYS:
             attributes["audio_type"] = "earpiece"
             attributes["other_earpiece_volume"] = state.audio_config.earpiece_volume
             attributes["other_earpiece_gain"] = state.audio_config.earpiece_gain
-        elif self.entity_description.key in ["speaker_volume", "speaker_gain"]:
+        elif self.entity_description.key in _SPEAKER_KEYS:
             attributes["audio_type"] = "speaker"
             attributes["other_speaker_volume"] = state.audio_config.speaker_volume
             attributes["other_speaker_gain"] = state.audio_config.speaker_gain
@@ -4,6 +4,8 @@ from __future__ import annotations
 
 import asyncio
 import logging
+from collections import deque
+from itertools import islice
 from typing import Any, Callable
 from datetime import datetime, timedelta
 from dataclasses import dataclass
@@ -54,7 +56,7 @@ class TsuryPhoneResilience:
 
         # Sequence tracking
         self._last_sequence = 0
-        self._sequence_history: list[int] = []
+        self._sequence_history: deque[int] = deque(maxlen=100)
         self._sequence_overflow_detected = False
 
         # Reboot detection
@@ -110,7 +112,8 @@ class TsuryPhoneResilience:
         # First event
         if self._last_sequence == 0:
             self._last_sequence = current_seq
-            self._sequence_history = [current_seq]
+            self._sequence_history.clear()
+            self._sequence_history.append(current_seq)
             return True
 
         # Check for sequence regression (potential reboot)
@@ -142,20 +145,17 @@ class TsuryPhoneResilience:
             self._sequence_overflow_detected = True
             await self._handle_sequence_overflow()
 
-        # Check for duplicate events
-        if current_seq in self._sequence_history[-10:]:  # Check last 10 events
+        # Check for duplicate events among the last 10 sequence numbers
+        if current_seq in islice(reversed(self._sequence_history), 10):
             _LOGGER.warning("Duplicate event sequence detected: %d", current_seq)
             self.stats.events_dropped += 1
             return False  # Drop duplicate
 
         # Update tracking
         self._last_sequence = current_seq
+        # Bounded deque keeps only the most recent sequence numbers
         self._sequence_history.append(current_seq)
 
-        # Keep only recent sequence history
-        if len(self._sequence_history) > 100:
-            self._sequence_history = self._sequence_history[-100:]
-
         return True
 
     async def _handle_potential_reboot(
@@ -177,7 +177,7 @@ class TsuryPhoneResilience:
             }
 
         # Mark reboot in event
-        event._reboot_detected = True
+        event.reboot_detected = True
 
         # Start reboot confirmation task
         if self._reboot_detection_task:
@@ -354,11 +354,10 @@ class TsuryPhoneResilience:
         _LOGGER.info("Attempting recovery from WebSocket error")
 
         try:
-            # Restart WebSocket connection
+            # Restart WebSocket connection; the connection manager retries with
+            # backoff if the device is not ready yet, so no fixed settle delay
             if self.coordinator._websocket_client:
-                await self.coordinator._websocket_client.disconnect()
-                await asyncio.sleep(2)
-                await self.coordinator._websocket_client.connect()
+                await self.coordinator._websocket_client.reconnect()
 
                 _LOGGER.info("Successfully recovered from WebSocket error")
                 self.stats.websocket_reconnections += 1
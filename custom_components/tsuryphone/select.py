@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import logging
-from typing import Any
+from types import MappingProxyType
+from typing import Any, Final
 
 from homeassistant.components.select import SelectEntity, SelectEntityDescription
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
@@ -22,6 +23,27 @@ from .validation import is_valid_ring_pattern
 
 _LOGGER = logging.getLogger(__name__)
 
+# Option shown (and accepted) by the list-backed selects for "nothing selected"
+_NO_SELECTION_OPTION: Final = "None"
+
+# Preset name by pattern string (preset patterns are unique)
+_RING_PRESET_BY_PATTERN: Final = MappingProxyType(
+    {pattern: name for name, pattern in RING_PATTERN_PRESETS.items()}
+)
+
+# State attribute each select builds its options from. The coordinator
+# replaces these lists rather than mutating them (and strings are immutable),
+# so identity tells whether the labels need rebuilding.
+_OPTION_SOURCE_ATTRS: Final = MappingProxyType(
+    {
+        "ring_pattern": "ring_pattern",
+        "quick_dial": "quick_dials",
+        "blocked_number": "blocked_numbers",
+        "priority_number": "priority_callers",
+        "webhook_action": "webhooks",
+    }
+)
+
 SELECT_DESCRIPTIONS = (
     SelectEntityDescription(
         key="ring_pattern",
@@ -89,6 +111,12 @@ class TsuryPhoneSelect(
         self._device_info = device_info
         self._quick_dial_option_map: dict[str, str | None] = {}
         self._ring_pattern_option_map: dict[str, str] = {}
+        self._options_source: Any = None
+        self._options_cache: list[str] = []
+        # Option label -> entry ID (or webhook code) for list-backed selects
+        self._label_to_value: dict[str, str] = {}
+        # What the last coordinator-driven state write showed
+        self._last_written_state: tuple[Any, ...] | None = None
 
         # Generate unique ID
         self._attr_unique_id = f"{device_info.device_id}_{description.key}"
@@ -96,9 +124,43 @@ class TsuryPhoneSelect(
         # Set device info
         self._attr_device_info = get_device_info(device_info)
 
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only when something this select shows actually changed."""
+        # The coordinator broadcasts every event (and every second of a call);
+        # most of those leave the selects untouched
+        written_state = (
+            self.available,
+            self.current_option,
+            self.options,
+            self.extra_state_attributes,
+        )
+        if written_state == self._last_written_state:
+            return
+
+        self._last_written_state = written_state
+        self.async_write_ha_state()
+
     @property
     def options(self) -> list[str]:
         """Return the list of available options."""
+        return self._current_options()
+
+    def _current_options(self) -> list[str]:
+        """Return cached options, rebuilding them if their source changed."""
+        source_attr = _OPTION_SOURCE_ATTRS.get(self.entity_description.key)
+        if source_attr is None:
+            return self._build_options()
+
+        source = getattr(self.coordinator.data, source_attr)
+        if source is not self._options_source:
+            self._options_cache = self._build_options()
+            # Hold the source itself (not its id) so it cannot be recycled
+            self._options_source = source
+        return self._options_cache
+
+    def _build_options(self) -> list[str]:
+        """Build the option labels for this select."""
         if self.entity_description.key == "ring_pattern":
             return self._get_ring_pattern_options()
         elif self.entity_description.key == "quick_dial":
@@ -156,22 +218,13 @@ class TsuryPhoneSelect(
         """Get current ring pattern option."""
         current_pattern = state.ring_pattern
 
-        option_map = (
-            self._ring_pattern_option_map or self._build_ring_pattern_option_map()
-        )
-        reverse_map = {value: label for label, value in option_map.items()}
-
-        preset_match = next(
-            (
-                name
-                for name, pattern in RING_PATTERN_PRESETS.items()
-                if pattern == current_pattern
-            ),
-            None,
-        )
+        preset_match = _RING_PRESET_BY_PATTERN.get(current_pattern)
+        if preset_match:
+            return RING_PATTERN_PRESET_LABELS[preset_match]
 
-        if preset_match and preset_match in reverse_map:
-            return reverse_map[preset_match]
+        # Rebuilds the option map if the pattern changed since options were read
+        self._current_options()
+        option_map = self._ring_pattern_option_map
 
         if current_pattern:
             return next(
@@ -179,7 +232,7 @@ class TsuryPhoneSelect(
                 "Custom",
             )
 
-        return reverse_map.get("Default", next(iter(option_map)))
+        return RING_PATTERN_PRESET_LABELS.get("Default", next(iter(option_map)))
 
     async def _select_ring_pattern(self, option: str) -> None:
         """Select ring pattern option."""
@@ -205,7 +258,7 @@ class TsuryPhoneSelect(
         self.coordinator.data.ring_pattern = pattern
 
         # Trigger coordinator update
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_refresh_if_disconnected()
 
     def _format_quick_dial_option(self, entry: QuickDialEntry) -> str:
         """Return a user-facing label for a quick dial entry."""
@@ -220,7 +273,7 @@ class TsuryPhoneSelect(
         self, state: TsuryPhoneState
     ) -> dict[str, str | None]:
         """Build and cache option->ID mapping for quick dial select."""
-        option_map: dict[str, str | None] = {"None": None}
+        option_map: dict[str, str | None] = {_NO_SELECTION_OPTION: None}
 
         quick_dials = sorted(
             state.quick_dials or [],
@@ -255,8 +308,8 @@ class TsuryPhoneSelect(
                 if entry_id == selected_id:
                     return option_label
 
-        # Default to "None" if nothing selected or selection not found
-        return "None"
+        # Default to no selection if nothing selected or selection not found
+        return _NO_SELECTION_OPTION
 
     async def _select_quick_dial(self, option: str) -> None:
         """Select quick dial option."""
@@ -266,7 +319,7 @@ class TsuryPhoneSelect(
         if option_map is None or option not in option_map:
             option_map = self._build_quick_dial_option_map(state)
 
-        if option == "None":
+        if option == _NO_SELECTION_OPTION:
             previous = self.coordinator.selected_quick_dial_id
             self.coordinator.selected_quick_dial_id = None
             if previous is not None:
@@ -278,9 +331,9 @@ class TsuryPhoneSelect(
         if not entry_id:
             raise HomeAssistantError(f"Unknown quick dial option: {option}")
 
-        if state.quick_dials and entry_id not in [
-            entry.id for entry in state.quick_dials
-        ]:
+        if state.quick_dials and not any(
+            entry.id == entry_id for entry in state.quick_dials
+        ):
             raise HomeAssistantError(
                 f"Quick dial ID '{entry_id}' not found in current list"
             )
@@ -300,18 +353,12 @@ class TsuryPhoneSelect(
         """Get blocked number options."""
         state: TsuryPhoneState = self.coordinator.data
 
-        if not state.blocked_numbers:
-            return ["None"]
+        label_map: dict[str, str] = {}
+        for entry in state.blocked_numbers:
+            label_map.setdefault(self._format_blocked_option(entry), entry.id)
+        self._label_to_value = label_map
 
-        options = ["None"]
-        options.extend(
-            label
-            for label in sorted(
-                (self._format_blocked_option(entry) for entry in state.blocked_numbers),
-                key=str.casefold,
-            )
-        )
-        return options
+        return [_NO_SELECTION_OPTION, *sorted(label_map, key=str.casefold)]
 
     def _get_current_blocked_option(self, state: TsuryPhoneState) -> str:
         """Get currently selected blocked number."""
@@ -319,11 +366,11 @@ class TsuryPhoneSelect(
             for entry in state.blocked_numbers:
                 if entry.id == self.coordinator.selected_blocked_number_id:
                     return self._format_blocked_option(entry)
-        return "None"
+        return _NO_SELECTION_OPTION
 
     async def _select_blocked_number(self, option: str) -> None:
         """Select a blocked number entry."""
-        if option == "None":
+        if option == _NO_SELECTION_OPTION:
             previous = self.coordinator.selected_blocked_number_id
             self.coordinator.selected_blocked_number_id = None
             if previous is not None:
@@ -331,38 +378,28 @@ class TsuryPhoneSelect(
             _LOGGER.debug("Blocked number selection cleared")
             return
 
-        state: TsuryPhoneState = self.coordinator.data
-        for entry in state.blocked_numbers:
-            if self._format_blocked_option(entry) == option:
-                previous = self.coordinator.selected_blocked_number_id
-                self.coordinator.selected_blocked_number_id = entry.id
-                if previous != entry.id:
-                    self.coordinator.async_update_listeners()
-                _LOGGER.debug(
-                    "Selected blocked number: %s (ID: %s)", entry.number, entry.id
-                )
-                return
-
-        raise HomeAssistantError(f"Blocked number selection '{option}' not found")
+        # Rebuilds the label map if the list changed since options were read
+        self._current_options()
+        entry_id = self._label_to_value.get(option)
+        if entry_id is None:
+            raise HomeAssistantError(f"Blocked number selection '{option}' not found")
+
+        previous = self.coordinator.selected_blocked_number_id
+        self.coordinator.selected_blocked_number_id = entry_id
+        if previous != entry_id:
+            self.coordinator.async_update_listeners()
+        _LOGGER.debug("Selected blocked number: %s (ID: %s)", option, entry_id)
 
     def _get_priority_number_options(self) -> list[str]:
         """Get priority number options."""
         state: TsuryPhoneState = self.coordinator.data
-        if not state.priority_callers:
-            return ["None"]
-
-        options = ["None"]
-        options.extend(
-            number
-            for number in sorted(
-                (
-                    entry.display_number or entry.number
-                    for entry in state.priority_callers
-                ),
-                key=str.casefold,
-            )
-        )
-        return options
+
+        label_map: dict[str, str] = {}
+        for entry in state.priority_callers:
+            label_map.setdefault(entry.display_number or entry.number, entry.id)
+        self._label_to_value = label_map
+
+        return [_NO_SELECTION_OPTION, *sorted(label_map, key=str.casefold)]
 
     def _get_current_priority_option(self, state: TsuryPhoneState) -> str:
         """Get the currently selected priority number."""
@@ -370,11 +407,11 @@ class TsuryPhoneSelect(
             for entry in state.priority_callers:
                 if entry.id == self.coordinator.selected_priority_number_id:
                     return entry.display_number or entry.number
-        return "None"
+        return _NO_SELECTION_OPTION
 
     async def _select_priority_number(self, option: str) -> None:
         """Select priority number."""
-        if option == "None":
+        if option == _NO_SELECTION_OPTION:
             previous = self.coordinator.selected_priority_number_id
             self.coordinator.selected_priority_number_id = None
             if previous is not None:
@@ -382,18 +419,16 @@ class TsuryPhoneSelect(
             _LOGGER.debug("Priority selection cleared")
             return
 
-        state: TsuryPhoneState = self.coordinator.data
-        for entry in state.priority_callers:
-            candidate = entry.display_number or entry.number
-            if candidate == option:
-                previous = self.coordinator.selected_priority_number_id
-                self.coordinator.selected_priority_number_id = entry.id
-                if previous != entry.id:
-                    self.coordinator.async_update_listeners()
-                _LOGGER.debug("Selected priority number: %s", entry.number)
-                return
+        self._current_options()
+        entry_id = self._label_to_value.get(option)
+        if entry_id is None:
+            raise HomeAssistantError(f"Priority number '{option}' not found")
 
-        raise HomeAssistantError(f"Priority number '{option}' not found")
+        previous = self.coordinator.selected_priority_number_id
+        self.coordinator.selected_priority_number_id = entry_id
+        if previous != entry_id:
+            self.coordinator.async_update_listeners()
+        _LOGGER.debug("Selected priority number: %s", option)
 
     def _format_webhook_option(self, entry) -> str:
         """Format webhook select label."""
@@ -405,18 +440,13 @@ class TsuryPhoneSelect(
     def _get_webhook_action_options(self) -> list[str]:
         """Get webhook action options."""
         state: TsuryPhoneState = self.coordinator.data
-        if not state.webhooks:
-            return ["None"]
-
-        options = ["None"]
-        options.extend(
-            label
-            for label in sorted(
-                (self._format_webhook_option(entry) for entry in state.webhooks),
-                key=str.casefold,
-            )
-        )
-        return options
+
+        label_map: dict[str, str] = {}
+        for entry in state.webhooks:
+            label_map.setdefault(self._format_webhook_option(entry), entry.code)
+        self._label_to_value = label_map
+
+        return [_NO_SELECTION_OPTION, *sorted(label_map, key=str.casefold)]
 
     def _build_ring_pattern_option_map(self) -> dict[str, str]:
         """Build labeled ring pattern options for the select entity."""
@@ -426,14 +456,7 @@ class TsuryPhoneSelect(
         }
 
         current_pattern = self.coordinator.data.ring_pattern
-        preset_match = next(
-            (
-                name
-                for name, pattern in RING_PATTERN_PRESETS.items()
-                if pattern == current_pattern
-            ),
-            None,
-        )
+        preset_match = _RING_PRESET_BY_PATTERN.get(current_pattern)
 
         if current_pattern and not preset_match:
             custom_label = f"Custom ({current_pattern})"
@@ -451,11 +474,11 @@ class TsuryPhoneSelect(
             for entry in state.webhooks:
                 if entry.code == self.coordinator.selected_webhook_code:
                     return self._format_webhook_option(entry)
-        return "None"
+        return _NO_SELECTION_OPTION
 
     async def _select_webhook_action(self, option: str) -> None:
         """Select webhook action."""
-        if option == "None":
+        if option == _NO_SELECTION_OPTION:
             previous = self.coordinator.selected_webhook_code
             self.coordinator.selected_webhook_code = None
             if previous is not None:
@@ -463,17 +486,16 @@ class TsuryPhoneSelect(
             _LOGGER.debug("Webhook selection cleared")
             return
 
-        state: TsuryPhoneState = self.coordinator.data
-        for entry in state.webhooks:
-            if self._format_webhook_option(entry) == option:
-                previous = self.coordinator.selected_webhook_code
-                self.coordinator.selected_webhook_code = entry.code
-                if previous != entry.code:
-                    self.coordinator.async_update_listeners()
-                _LOGGER.debug("Selected webhook action: %s", entry.code)
-                return
-
-        raise HomeAssistantError(f"Webhook action '{option}' not found")
+        self._current_options()
+        code = self._label_to_value.get(option)
+        if code is None:
+            raise HomeAssistantError(f"Webhook action '{option}' not found")
+
+        previous = self.coordinator.selected_webhook_code
+        self.coordinator.selected_webhook_code = code
+        if previous != code:
+            self.coordinator.async_update_listeners()
+        _LOGGER.debug("Selected webhook action: %s", code)
 
     @property
     def extra_state_attributes(self) -> dict[str, any] | None:
@@ -27,7 +27,7 @@ from homeassistant.helpers.typing import StateType
 from . import get_device_info, TsuryPhoneConfigEntry
 from .const import DOMAIN, AppState
 from .coordinator import TsuryPhoneDataUpdateCoordinator
-from .models import TsuryPhoneState, CallInfo
+from .models import CallHistoryEntry, TsuryPhoneState, CallInfo
 
 SENSOR_DESCRIPTIONS = (
     SensorEntityDescription(
@@ -266,6 +266,10 @@ class TsuryPhoneSensor(
         # Set device info
         self._attr_device_info = get_device_info(device_info)
 
+        # Serialized call history attribute, reused until the history changes
+        self._history_entries_key: tuple[int, int, CallHistoryEntry] | None = None
+        self._history_entries: list[dict[str, Any]] = []
+
     @property
     def native_value(self) -> StateType:
         """Return the state of the sensor."""
@@ -547,19 +551,9 @@ class TsuryPhoneSensor(
 
             if state.call_history:
                 # Add the full call history as a list of dicts
-                attributes["entries"] = [
-                    {
-                        "number": entry.number,
-                        "name": entry.name,
-                        "call_type": entry.call_type,
-                        "is_incoming": entry.is_incoming,
-                        "duration_s": entry.duration_s,
-                        "received_ts": entry.received_ts,
-                        "reason": entry.reason,
-                        "seq": entry.seq,
-                    }
-                    for entry in state.call_history
-                ]
+                attributes["entries"] = self._build_call_history_entries(
+                    state.call_history
+                )
 
                 # Add info about newest and oldest entries
                 newest = state.call_history[-1]  # Newest is last
@@ -599,6 +593,30 @@ class TsuryPhoneSensor(
 
         return attributes if attributes else None
 
+    def _build_call_history_entries(
+        self, history: list[CallHistoryEntry]
+    ) -> list[dict[str, Any]]:
+        """Serialize the call history, rebuilding only after it has changed."""
+        # Entries are complete when appended, so the list identity, length and
+        # newest entry identify the content; call timer ticks reuse the result
+        cache_key = (id(history), len(history), history[-1])
+        if cache_key != self._history_entries_key:
+            self._history_entries = [
+                {
+                    "number": entry.number,
+                    "name": entry.name,
+                    "call_type": entry.call_type,
+                    "is_incoming": entry.is_incoming,
+                    "duration_s": entry.duration_s,
+                    "received_ts": entry.received_ts,
+                    "reason": entry.reason,
+                    "seq": entry.seq,
+                }
+                for entry in history
+            ]
+            self._history_entries_key = cache_key
+        return self._history_entries
+
     def _build_current_call_attributes(
         self, state: TsuryPhoneState, *, include_summary: bool = False
     ) -> dict[str, Any]:
@@ -80,6 +80,7 @@ from .const import (
 from .coordinator import TsuryPhoneDataUpdateCoordinator
 from .api_client import TsuryPhoneAPIError
 from .dialing import DialingContext, sanitize_default_dialing_code
+from .models import CallHistoryEntry
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -390,6 +391,12 @@ def _normalize_number_for_service(
     return device_value
 
 
+def _call_timestamp_iso(entry: CallHistoryEntry) -> str | None:
+    """Return the entry timestamp as ISO text, converting it only once."""
+    timestamp = entry.timestamp
+    return timestamp.isoformat() if timestamp else None
+
+
 def _extract_ids(value: Any) -> set[str]:
     """Normalize a target value into a set of string IDs."""
     if not value:
@@ -793,7 +800,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
         try:
             await coordinator.api_client.set_ring_pattern(pattern)
-            await coordinator.async_request_refresh()
+            await coordinator.async_refresh_if_disconnected()
         except TsuryPhoneAPIError as err:
             raise HomeAssistantError(f"Failed to set ring pattern: {err}") from err
 
@@ -834,7 +841,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
         try:
             await coordinator.api_client.set_dnd(dnd_config)
-            await coordinator.async_request_refresh()
+            await coordinator.async_refresh_if_disconnected()
         except TsuryPhoneAPIError as err:
             raise HomeAssistantError(f"Failed to set DND: {err}") from err
 
@@ -863,7 +870,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
         try:
             await coordinator.api_client.set_audio_config(audio_config)
-            await coordinator.async_request_refresh()
+            await coordinator.async_refresh_if_disconnected()
         except TsuryPhoneAPIError as err:
             raise HomeAssistantError(f"Failed to set audio config: {err}") from err
 
@@ -878,7 +885,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
         try:
             await coordinator.api_client.set_dialing_config(sanitized_code)
-            await coordinator.async_request_refresh()
+            await coordinator.async_refresh_if_disconnected()
         except TsuryPhoneAPIError as err:
             raise HomeAssistantError(
                 f"Failed to set default dialing code: {err}"
@@ -898,9 +905,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                 {
                     "number": entry.number,
                     "call_type": entry.call_type,
-                    "timestamp": (
-                        entry.timestamp.isoformat() if entry.timestamp else None
-                    ),
+                    "timestamp": _call_timestamp_iso(entry),
                     "is_incoming": entry.is_incoming,
                     "duration_s": entry.duration_s,
                     "ts_device": entry.ts_device,
@@ -967,7 +972,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
         try:
             await coordinator.api_client.add_quick_dial(number, name, code)
-            await coordinator.async_request_refresh()
+            await coordinator.async_refresh_if_disconnected()
         except TsuryPhoneAPIError as err:
             raise HomeAssistantError(f"Failed to add quick dial: {err}") from err
 
@@ -981,7 +986,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
         try:
             await coordinator.api_client.remove_quick_dial_by_id(entry_id)
-            await coordinator.async_request_refresh()
+            await coordinator.async_refresh_if_disconnected()
         except TsuryPhoneAPIError as err:
             raise HomeAssistantError(f"Failed to remove quick dial: {err}") from err
 
@@ -1054,7 +1059,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                 await coordinator.api_client.remove_priority_caller_by_id(old_priority_entry.id)
                 await coordinator.api_client.add_priority_caller(number)
             
-            await coordinator.async_request_refresh()
+            await coordinator.async_refresh_if_disconnected()
         except TsuryPhoneAPIError as err:
             raise HomeAssistantError(f"Failed to edit contact: {err}") from err
 
@@ -1069,7 +1074,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             except TsuryPhoneAPIError as err:
                 errors.append(f"Failed to remove {entry.id}: {err}")
 
-        await coordinator.async_request_refresh()
+        await coordinator.async_refresh_if_disconnected()
 
         if errors:
             raise HomeAssistantError(
@@ -1091,7 +1096,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
         try:
             await coordinator.api_client.add_blocked_number(number, name)
-            await coordinator.async_request_refresh()
+            await coordinator.async_refresh_if_disconnected()
         except TsuryPhoneAPIError as err:
             raise HomeAssistantError(f"Failed to add blocked number: {err}") from err
 
@@ -1105,7 +1110,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
         try:
             await coordinator.api_client.remove_blocked_number_by_id(entry_id)
-            await coordinator.async_request_refresh()
+            await coordinator.async_refresh_if_disconnected()
         except TsuryPhoneAPIError as err:
             raise HomeAssistantError(f"Failed to remove blocked number: {err}") from err
 
@@ -1127,7 +1132,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             except TsuryPhoneAPIError as err:
                 errors.append(f"Failed to remove {entry.id}: {err}")
 
-        await coordinator.async_request_refresh()
+        await coordinator.async_refresh_if_disconnected()
 
         if errors:
             raise HomeAssistantError(
@@ -1173,7 +1178,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
         try:
             await coordinator.api_client.add_priority_caller(number)
-            await coordinator.async_request_refresh()
+            await coordinator.async_refresh_if_disconnected()
         except TsuryPhoneAPIError as err:
             raise HomeAssistantError(f"Failed to add priority caller: {err}") from err
 
@@ -1187,7 +1192,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
         try:
             await coordinator.api_client.remove_priority_caller_by_id(entry_id)
-            await coordinator.async_request_refresh()
+            await coordinator.async_refresh_if_disconnected()
         except TsuryPhoneAPIError as err:
             raise HomeAssistantError(
                 f"Failed to remove priority caller: {err}"
@@ -1226,7 +1231,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                 webhook_id=webhook_id,
                 action_name=name
             )
-            await coordinator.async_request_refresh()
+            await coordinator.async_refresh_if_disconnected()
         except TsuryPhoneAPIError as err:
             raise HomeAssistantError(f"Failed to add webhook: {err}") from err
 
@@ -1237,7 +1242,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
         try:
             await coordinator.api_client.remove_webhook_action(code)
-            await coordinator.async_request_refresh()
+            await coordinator.async_refresh_if_disconnected()
         except TsuryPhoneAPIError as err:
             raise HomeAssistantError(f"Failed to remove webhook: {err}") from err
 
@@ -1247,7 +1252,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
         try:
             await coordinator.api_client.clear_webhooks()
-            await coordinator.async_request_refresh()
+            await coordinator.async_refresh_if_disconnected()
         except TsuryPhoneAPIError as err:
             raise HomeAssistantError(f"Failed to clear webhooks: {err}") from err
 
@@ -1305,7 +1310,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
 
         try:
             await coordinator.api_client.set_maintenance_mode(enabled)
-            await coordinator.async_request_refresh()
+            await coordinator.async_refresh_if_disconnected()
         except TsuryPhoneAPIError as err:
             raise HomeAssistantError(f"Failed to set maintenance mode: {err}") from err
 
@@ -1320,9 +1325,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
             "missed_calls": [
                 {
                     "number": entry.number,
-                    "timestamp": (
-                        entry.timestamp.isoformat() if entry.timestamp else None
-                    ),
+                    "timestamp": _call_timestamp_iso(entry),
                     "call_type": entry.call_type,
                     "ts_device": entry.ts_device,
                     "received_ts": entry.received_ts,
@@ -1410,7 +1413,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                     results["failed"].append({"code": code, "error": str(err)})
                     _LOGGER.warning("Failed to add quick dial entry %s: %s", code, err)
 
-            await coordinator.async_request_refresh()
+            await coordinator.async_refresh_if_disconnected()
             return results
 
         except TsuryPhoneAPIError as err:
@@ -1487,7 +1490,7 @@ async def async_setup_services(hass: HomeAssistant) -> None:
                     results["failed"].append({"number": number, "error": str(err)})
                     _LOGGER.warning("Failed to add blocked number %s: %s", number, err)
 
-            await coordinator.async_request_refresh()
+            await coordinator.async_refresh_if_disconnected()
             return results
 
         except TsuryPhoneAPIError as err:
@@ -2,12 +2,13 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
 from datetime import datetime, timedelta
 from typing import Any
 
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.storage import Store
 from homeassistant.util import dt as dt_util
 
@@ -31,6 +32,11 @@ DEFAULT_CALL_HISTORY_RETENTION_DAYS = 30
 DEFAULT_STATE_BACKUP_RETENTION_DAYS = 7
 DEFAULT_MAX_CALL_HISTORY_ENTRIES = 1000
 
+# Delay used to coalesce bursts of call history changes into one write
+CALL_HISTORY_SAVE_DELAY = 10  # seconds
+# Delay used to coalesce event-driven device state backups into one write
+DEVICE_STATE_SAVE_DELAY = 30  # seconds
+
 
 class TsuryPhoneStorageCache:
     """Manage persistent storage cache for TsuryPhone data."""
@@ -103,9 +109,12 @@ class TsuryPhoneStorageCache:
     async def _load_cache(self) -> None:
         """Load data from storage into memory cache."""
         try:
-            # Load call history
-            call_history_data = await self._call_history_store.async_load()
-            
+            # Both stores are read in the executor; load them concurrently
+            call_history_data, device_state_data = await asyncio.gather(
+                self._call_history_store.async_load(),
+                self._device_state_store.async_load(),
+            )
+
             if call_history_data:
                 entries_raw = call_history_data.get("entries", [])
                 self._call_history_cache = [
@@ -113,8 +122,6 @@ class TsuryPhoneStorageCache:
                     for entry in entries_raw
                 ]
 
-            # Load device state backup
-            device_state_data = await self._device_state_store.async_load()
             if device_state_data:
                 self._device_state_cache = device_state_data.get("state", {})
 
@@ -135,21 +142,39 @@ class TsuryPhoneStorageCache:
             # Update in-memory cache
             self._call_history_cache = call_history.copy()
 
-            # Clean up old entries before saving
-            cleaned_entries = await self._cleanup_call_history(call_history)
-
-            # Convert to serializable format
-            data = {
-                "entries": [entry.to_dict() for entry in cleaned_entries],
-                "last_updated": dt_util.utcnow().isoformat(),
-                "device_id": self.device_id,
-            }
-
-            await self._call_history_store.async_save(data)
+            await self._call_history_store.async_save(
+                self._call_history_data_to_save()
+            )
 
         except Exception as err:
             _LOGGER.error("Failed to save call history: %s", err, exc_info=True)
 
+    @callback
+    def async_schedule_save_call_history(
+        self, call_history: list[CallHistoryEntry]
+    ) -> None:
+        """Schedule a delayed call history write.
+
+        Repeated calls within CALL_HISTORY_SAVE_DELAY collapse into a single
+        write, and serialization happens once when the Store flushes.
+        """
+        self._call_history_cache = list(call_history)
+        self._call_history_store.async_delay_save(
+            self._call_history_data_to_save, CALL_HISTORY_SAVE_DELAY
+        )
+
+    @callback
+    def _call_history_data_to_save(self) -> dict[str, Any]:
+        """Return the cached call history in its stored format."""
+        # Clean up old entries before saving
+        cleaned_entries = self._cleanup_call_history(self._call_history_cache)
+
+        return {
+            "entries": [entry.to_dict() for entry in cleaned_entries],
+            "last_updated": dt_util.utcnow().isoformat(),
+            "device_id": self.device_id,
+        }
+
     async def async_load_call_history(self) -> list[CallHistoryEntry]:
         """Load call history from persistent storage."""
         if not self._cache_loaded:
@@ -162,55 +187,75 @@ class TsuryPhoneStorageCache:
     ) -> None:
         """Save device state backup to persistent storage."""
         try:
-            # Create state backup (excluding sensitive data)
-            state_backup = {
-                "app_state": state.app_state.value,
-                "connected": state.connected,
-                "last_seen": state.last_seen,
-                "send_mode_enabled": send_mode_enabled,
-                "dnd_config": {
-                    "force": state.dnd_config.force,
-                    "scheduled": state.dnd_config.scheduled,
-                    "start_hour": state.dnd_config.start_hour,
-                    "start_minute": state.dnd_config.start_minute,
-                    "end_hour": state.dnd_config.end_hour,
-                    "end_minute": state.dnd_config.end_minute,
-                },
-                "audio_config": {
-                    "earpiece_volume": state.audio_config.earpiece_volume,
-                    "earpiece_gain": state.audio_config.earpiece_gain,
-                    "speaker_volume": state.audio_config.speaker_volume,
-                    "speaker_gain": state.audio_config.speaker_gain,
-                },
-                "ring_pattern": state.ring_pattern,
-                "maintenance_mode": state.maintenance_mode,
-                "stats": {
-                    "calls_total": state.stats.calls_total,
-                    "calls_incoming": state.stats.calls_incoming,
-                    "calls_outgoing": state.stats.calls_outgoing,
-                    "calls_blocked": state.stats.calls_blocked,
-                    "talk_time_seconds": state.stats.talk_time_seconds,
-                    "uptime_seconds": state.stats.uptime_seconds,
-                    "free_heap_bytes": state.stats.free_heap_bytes,
-                    "rssi_dbm": state.stats.rssi_dbm,
-                },
-                "quick_dial_count": state.quick_dial_count,
-                "blocked_count": state.blocked_count,
-                "call_history_size": state.call_history_size,
-                "last_seq": state.last_seq,
-            }
+            await self._device_state_store.async_save(
+                self._device_state_data_to_save(state, send_mode_enabled)
+            )
+        except Exception as err:
+            _LOGGER.error("Failed to save device state to cache: %s", err)
 
-            data = {
-                "state": state_backup,
-                "last_updated": dt_util.utcnow().isoformat(),
-                "device_id": self.device_id,
-            }
+    @callback
+    def async_schedule_save_device_state(
+        self, state: TsuryPhoneState, send_mode_enabled: bool = False
+    ) -> None:
+        """Schedule a delayed device state backup.
+
+        The backup is built from the live state when the Store flushes, so a
+        burst of events produces one write reflecting the latest values.
+        """
+        self._device_state_store.async_delay_save(
+            lambda: self._device_state_data_to_save(state, send_mode_enabled),
+            DEVICE_STATE_SAVE_DELAY,
+        )
 
-            await self._device_state_store.async_save(data)
-            self._device_state_cache = state_backup
+    @callback
+    def _device_state_data_to_save(
+        self, state: TsuryPhoneState, send_mode_enabled: bool
+    ) -> dict[str, Any]:
+        """Build the device state backup in its stored format."""
+        # Create state backup (excluding sensitive data)
+        state_backup = {
+            "app_state": state.app_state.value,
+            "connected": state.connected,
+            "last_seen": state.last_seen,
+            "send_mode_enabled": send_mode_enabled,
+            "dnd_config": {
+                "force": state.dnd_config.force,
+                "scheduled": state.dnd_config.scheduled,
+                "start_hour": state.dnd_config.start_hour,
+                "start_minute": state.dnd_config.start_minute,
+                "end_hour": state.dnd_config.end_hour,
+                "end_minute": state.dnd_config.end_minute,
+            },
+            "audio_config": {
+                "earpiece_volume": state.audio_config.earpiece_volume,
+                "earpiece_gain": state.audio_config.earpiece_gain,
+                "speaker_volume": state.audio_config.speaker_volume,
+                "speaker_gain": state.audio_config.speaker_gain,
+            },
+            "ring_pattern": state.ring_pattern,
+            "maintenance_mode": state.maintenance_mode,
+            "stats": {
+                "calls_total": state.stats.calls_total,
+                "calls_incoming": state.stats.calls_incoming,
+                "calls_outgoing": state.stats.calls_outgoing,
+                "calls_blocked": state.stats.calls_blocked,
+                "talk_time_seconds": state.stats.talk_time_seconds,
+                "uptime_seconds": state.stats.uptime_seconds,
+                "free_heap_bytes": state.stats.free_heap_bytes,
+                "rssi_dbm": state.stats.rssi_dbm,
+            },
+            "quick_dial_count": state.quick_dial_count,
+            "blocked_count": state.blocked_count,
+            "call_history_size": state.call_history_size,
+            "last_seq": state.last_seq,
+        }
+        self._device_state_cache = state_backup
 
-        except Exception as err:
-            _LOGGER.error("Failed to save device state to cache: %s", err)
+        return {
+            "state": state_backup,
+            "last_updated": dt_util.utcnow().isoformat(),
+            "device_id": self.device_id,
+        }
 
     async def async_load_device_state(self) -> dict[str, Any]:
         """Load device state backup from persistent storage."""
@@ -275,57 +320,36 @@ class TsuryPhoneStorageCache:
             return max(backups, key=lambda b: b["timestamp"])
         return None
 
-    async def _cleanup_call_history(
+    def _cleanup_call_history(
         self, entries: list[CallHistoryEntry]
     ) -> list[CallHistoryEntry]:
         """Clean up call history entries based on retention policies."""
         if not entries:
             return entries
 
-        aware_min = datetime.min.replace(tzinfo=dt_util.UTC)
-
-        def _entry_timestamp(entry: CallHistoryEntry) -> datetime:
-            # NOTE: ts_device and call_start_ts are device uptime (millis()), not epoch timestamps.
-            # Always use received_ts (HA timestamp) for sorting and age comparison.
-            if entry.received_ts:
-                try:
-                    ts = dt_util.utc_from_timestamp(entry.received_ts)
-                    if ts.tzinfo:
-                        return dt_util.as_utc(ts)
-                    return ts.replace(tzinfo=dt_util.UTC)
-                except (ValueError, OSError):
-                    pass
-            return aware_min
-
-        sorted_entries = sorted(entries, key=_entry_timestamp, reverse=True)
+        # NOTE: ts_device and call_start_ts are device uptime (millis()), not epoch
+        # timestamps. Always use received_ts (HA epoch seconds) for sorting and age
+        # comparison; compare it as a float so no datetimes are built per entry.
+        sorted_entries = sorted(
+            entries,
+            key=lambda entry: entry.received_ts or float("-inf"),
+            reverse=True,
+        )
 
         # Apply retention policies
         cleaned_entries = []
-        cutoff_date = dt_util.utcnow() - timedelta(
-            days=self.call_history_retention_days
-        )
+        cutoff_ts = (
+            dt_util.utcnow() - timedelta(days=self.call_history_retention_days)
+        ).timestamp()
 
-        for idx, entry in enumerate(sorted_entries):
-            # NOTE: ts_device and call_start_ts from firmware are device uptime in milliseconds (millis()),
-            # NOT Unix epoch timestamps! We must always use received_ts (HA timestamp) for age comparison.
-            entry_ts = None
-            if entry.received_ts:
-                try:
-                    entry_ts = dt_util.utc_from_timestamp(entry.received_ts)
-                except (ValueError, OSError):
-                    pass
-            
-            if not entry_ts:
+        for entry in sorted_entries:
+            received_ts = entry.received_ts
+            if not received_ts:
                 cleaned_entries.append(entry)
                 continue
-            
+
             # Skip entries that are too old
-            if entry_ts.tzinfo:
-                entry_ts = dt_util.as_utc(entry_ts)
-            else:
-                entry_ts = entry_ts.replace(tzinfo=dt_util.UTC)
-            
-            if entry_ts < cutoff_date:
+            if received_ts < cutoff_ts:
                 continue
 
             # Skip if we've reached max entries
@@ -348,7 +372,7 @@ class TsuryPhoneStorageCache:
             # Clean up call history
             if self._call_history_cache:
                 original_count = len(self._call_history_cache)
-                cleaned_entries = await self._cleanup_call_history(
+                cleaned_entries = self._cleanup_call_history(
                     self._call_history_cache
                 )
                 stats["call_history_removed"] = original_count - len(cleaned_entries)
@@ -140,7 +140,7 @@ class TsuryPhoneSwitch(
         self.coordinator.data.dnd_config.force = enabled
 
         # Trigger coordinator update
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_refresh_if_disconnected()
 
     async def _set_maintenance_mode(self, enabled: bool) -> None:
         """Set maintenance mode."""
@@ -150,7 +150,7 @@ class TsuryPhoneSwitch(
         self.coordinator.data.maintenance_mode = enabled
 
         # Trigger coordinator update
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_refresh_if_disconnected()
 
     async def _set_dnd_schedule_enabled(self, enabled: bool) -> None:
         """Set DND scheduled mode."""
@@ -161,7 +161,7 @@ class TsuryPhoneSwitch(
         self.coordinator.data.dnd_config.scheduled = enabled
 
         # Trigger coordinator update
-        await self.coordinator.async_request_refresh()
+        await self.coordinator.async_refresh_if_disconnected()
 
     @property
     def extra_state_attributes(self) -> dict[str, any] | None:
@@ -225,5 +225,5 @@ class TsuryPhoneSwitch(
 
     def _set_send_mode(self, enabled: bool) -> None:
         """Set send mode (local integration state only)."""
+        # The coordinator broadcasts the change to every entity, this one included
         self.coordinator.set_send_mode(enabled)
-        self.async_write_ha_state()
@@ -236,6 +236,9 @@ class TsuryPhoneText(CoordinatorEntity[TsuryPhoneDataUpdateCoordinator], TextEnt
 
     entity_description: TsuryPhoneTextDescription
 
+    _attr_mode = "text"
+    _attr_native_min_length = 0
+
     def __init__(
         self,
         coordinator: TsuryPhoneDataUpdateCoordinator,
@@ -251,9 +254,7 @@ class TsuryPhoneText(CoordinatorEntity[TsuryPhoneDataUpdateCoordinator], TextEnt
 
         self._attr_unique_id = f"{device_info.device_id}_{description.key}"
         self._attr_device_info = get_device_info(device_info)
-        self._attr_mode = "text"
         self._attr_native_max_length = description.max_length
-        self._attr_native_min_length = 0
 
     @property
     def native_value(self) -> str:
@@ -316,8 +317,10 @@ class TsuryPhoneText(CoordinatorEntity[TsuryPhoneDataUpdateCoordinator], TextEnt
 
         buffer[field_name] = normalized
         if current != normalized:
+            # Rewrites this entity along with the dependent buttons
             self.coordinator.async_update_listeners()
-        self.async_write_ha_state()
+        else:
+            self.async_write_ha_state()
 
     @property
     def extra_state_attributes(self) -> dict[str, str] | None:
@@ -387,7 +390,6 @@ class TsuryPhoneText(CoordinatorEntity[TsuryPhoneDataUpdateCoordinator], TextEnt
         # Update coordinator state optimistically
         setattr(dnd_config, field_name, number)
         self.coordinator.async_update_listeners()
-        self.async_write_ha_state()
 
     async def _async_set_dialing_code(self, value: str) -> None:
         """Apply default dialing code changes immediately when edited."""
@@ -436,5 +438,3 @@ class TsuryPhoneText(CoordinatorEntity[TsuryPhoneDataUpdateCoordinator], TextEnt
 
         self.coordinator.data.ring_pattern = pattern
         self.coordinator.async_update_listeners()
-        self.async_write_ha_state()
-        self.async_write_ha_state()
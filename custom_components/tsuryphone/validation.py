@@ -2,11 +2,14 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
+import re
 from typing import Final
 
 from .const import MAX_PATTERN_LENGTH
 
-_VALID_PATTERN_CHARS: Final = set("0123456789,x")
+# Comma-separated on/off durations with an optional "x<repeats>" suffix
+_RING_PATTERN_RE: Final = re.compile(r"([0-9]+(?:,[0-9]+)*)(?:x([0-9]+))?")
 
 
 def _normalize_pattern(pattern: str | None) -> str:
@@ -16,8 +19,13 @@ def _normalize_pattern(pattern: str | None) -> str:
     return pattern.strip()
 
 
+@lru_cache(maxsize=128)
 def is_valid_ring_pattern(pattern: str | None) -> bool:
-    """Validate ring pattern syntax to mirror firmware expectations."""
+    """Validate ring pattern syntax to mirror firmware expectations.
+
+    Results are memoized: the same handful of presets and user patterns are
+    checked repeatedly from select options, text entities and the options flow.
+    """
     normalized = _normalize_pattern(pattern)
     if not normalized:
         # Empty pattern defers to the device's native default
@@ -26,30 +34,19 @@ def is_valid_ring_pattern(pattern: str | None) -> bool:
     if len(normalized) > MAX_PATTERN_LENGTH:
         return False
 
-    if any(char not in _VALID_PATTERN_CHARS for char in normalized):
+    match = _RING_PATTERN_RE.fullmatch(normalized)
+    if match is None:
         return False
 
-    base = normalized
-    repeat_count = 1
-
-    if "x" in normalized:
-        base, repeat_str = normalized.rsplit("x", 1)
-        if not repeat_str or not repeat_str.isdigit():
-            return False
-        repeat_count = int(repeat_str)
-        if repeat_count <= 0:
-            repeat_count = 1
+    base, repeat_str = match.groups()
+    repeat_count = int(repeat_str) if repeat_str else 1
+    if repeat_count <= 0:
+        repeat_count = 1
 
     segments = base.split(",")
-    if not segments or any(segment == "" for segment in segments):
+    if any(int(segment) <= 0 for segment in segments):
         return False
 
-    for segment in segments:
-        if not segment.isdigit():
-            return False
-        if int(segment) <= 0:
-            return False
-
     if repeat_count > 1:
         return len(segments) % 2 == 0
 
@@ -3,14 +3,14 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
-from typing import Any, Callable
+from typing import Any, Callable, Final
 import time
 
 import aiohttp
 from homeassistant.core import HomeAssistant
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.util.json import json_loads
 
 from .const import (
     WEBSOCKET_RECONNECT_DELAY,
@@ -25,6 +25,8 @@ _LOGGER = logging.getLogger(__name__)
 EventHandler = Callable[[TsuryPhoneEvent], None]
 ConnectionStateHandler = Callable[[str, dict[str, Any]], None]
 
+_CONNECT_TIMEOUT: Final = aiohttp.ClientTimeout(total=10)
+
 
 class TsuryPhoneWebSocketError(Exception):
     """WebSocket specific error."""
@@ -74,11 +76,7 @@ class TsuryPhoneWebSocketClient:
 
         # Phase P8: Resilience improvements
         self._consecutive_failures = 0
-        self._last_pong_time = 0.0
-        self._ping_task: asyncio.Task | None = None
-        self._ping_interval = 30  # seconds
-        self._ping_timeout = 10  # seconds
-        self._last_reboot_warning = 0.0
+        self._last_reboot_warning: float | None = None
         self._reboot_warning_interval = 60  # seconds
 
     def _notify_connection_state(self, state: str) -> None:
@@ -113,7 +111,6 @@ class TsuryPhoneWebSocketClient:
             "connect_time": self._connect_time,
             "disconnect_time": self._disconnect_time,
             "consecutive_failures": self._consecutive_failures,
-            "last_pong_time": self._last_pong_time,
         }
 
     async def start(self) -> None:
@@ -148,15 +145,6 @@ class TsuryPhoneWebSocketClient:
                 pass
             self._listen_task = None
 
-        # Phase P8: Cancel ping task
-        if self._ping_task:
-            self._ping_task.cancel()
-            try:
-                await self._ping_task
-            except asyncio.CancelledError:
-                pass
-            self._ping_task = None
-
         # Close WebSocket connection
         await self._disconnect()
 
@@ -171,9 +159,6 @@ class TsuryPhoneWebSocketClient:
                     self._connection_attempts = 0
                     self._consecutive_failures = 0
 
-                    # Phase P8: Start ping/pong keepalive
-                    self._ping_task = asyncio.create_task(self._ping_keepalive())
-
                     # Start listening for events
                     self._listen_task = asyncio.create_task(self._listen_for_events())
                     await self._listen_task
@@ -213,14 +198,18 @@ class TsuryPhoneWebSocketClient:
         try:
             self._websocket = await self._session.ws_connect(
                 self._url,
-                timeout=aiohttp.ClientTimeout(total=10),
-                heartbeat=30,  # Send ping every 30 seconds
+                timeout=_CONNECT_TIMEOUT,
+                # aiohttp pings every 30 seconds and closes the socket when no
+                # pong arrives, which ends the listen loop and triggers a reconnect
+                heartbeat=30,
+                # Small JSON frames on a LAN gain nothing from permessage-deflate
+                compress=0,
             )
             self._connected = True
             self._connect_time = time.time()
             self._disconnect_time = 0
             self._last_seq = 0
-            self._last_reboot_warning = 0.0
+            self._last_reboot_warning = None
             _LOGGER.info("WebSocket connected successfully")
             self._notify_connection_state("connected")
 
@@ -272,7 +261,12 @@ class TsuryPhoneWebSocketClient:
     async def _handle_message(self, data: str) -> None:
         """Handle incoming WebSocket message."""
         try:
-            message = json.loads(data)
+            message = json_loads(data)
+        except ValueError as err:  # orjson and stdlib decode errors
+            _LOGGER.error("Invalid JSON received from WebSocket: %s", err)
+            return
+
+        try:
             self._events_received += 1
 
             # Add to processing queue
@@ -294,8 +288,6 @@ class TsuryPhoneWebSocketClient:
             # Process events from queue
             await self._process_event_queue()
 
-        except json.JSONDecodeError as err:
-            _LOGGER.error("Invalid JSON received from WebSocket: %s", err)
         except Exception as err:
             _LOGGER.exception("Error handling WebSocket message: %s", err)
 
@@ -334,8 +326,11 @@ class TsuryPhoneWebSocketClient:
             seq = raw_event.get("seq", 0)
             previous_seq = self._last_seq
             if seq <= previous_seq and previous_seq > 0:
-                now = time.time()
-                if now - self._last_reboot_warning >= self._reboot_warning_interval:
+                now = time.monotonic()
+                if (
+                    self._last_reboot_warning is None
+                    or now - self._last_reboot_warning >= self._reboot_warning_interval
+                ):
                     _LOGGER.warning(
                         "Sequence regression detected: %d <= %d (possible device reboot)",
                         seq,
@@ -353,7 +348,7 @@ class TsuryPhoneWebSocketClient:
 
             self._last_seq = max(seq, previous_seq)
             if seq > previous_seq:
-                self._last_reboot_warning = 0.0
+                self._last_reboot_warning = None
 
             # Convert to structured event
             event = TsuryPhoneEvent.from_json(raw_event)
@@ -381,38 +376,6 @@ class TsuryPhoneWebSocketClient:
         _LOGGER.debug("Resetting WebSocket sequence tracking")
         self._last_seq = 0
 
-    async def _ping_keepalive(self) -> None:
-        """Send periodic ping to keep connection alive and detect stale connections."""
-        while self._connected and self._websocket:
-            try:
-                await asyncio.sleep(self._ping_interval)
-
-                if not self._connected or not self._websocket:
-                    break
-
-                # Send ping frame
-                _LOGGER.debug("Sending WebSocket ping")
-                pong_waiter = await self._websocket.ping()
-                
-                # Check if ping returned a valid waiter
-                if pong_waiter is None:
-                    _LOGGER.debug("WebSocket ping returned None - connection closed")
-                    break
-
-                try:
-                    await asyncio.wait_for(pong_waiter, timeout=self._ping_timeout)
-                    self._last_pong_time = time.time()
-                    _LOGGER.debug("Received WebSocket pong")
-
-                except asyncio.TimeoutError:
-                    _LOGGER.warning("WebSocket ping timeout - connection may be stale")
-                    # Let the connection manager handle reconnection
-                    break
-
-            except Exception as err:
-                _LOGGER.debug("Ping keepalive error: %s", err)
-                break
-
     async def disconnect(self) -> None:
         """Public method to disconnect WebSocket."""
         await self.stop()
@@ -441,12 +404,6 @@ class TsuryPhoneWebSocketClient:
         if self._consecutive_failures > 3:
             issues.append(f"High consecutive failures: {self._consecutive_failures}")
 
-        # Check stale pong
-        if self._last_pong_time > 0:
-            time_since_pong = time.time() - self._last_pong_time
-            if time_since_pong > self._ping_interval * 3:
-                issues.append(f"Stale pong response: {time_since_pong:.1f}s ago")
-
         # Check queue overflows
         if self._queue_overflows > 0:
             issues.append(f"Event queue overflows: {self._queue_overflows}")